@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import asyncio
+import json
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -9,7 +10,8 @@ import uvicorn
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
+from fastapi.encoders import jsonable_encoder
 
 from systems.safety_manager import SafetySystemManager
 from systems.emergency_stop import EmergencyStopSystem
@@ -54,10 +56,14 @@ class ConnectionManager:
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
     async def broadcast(self, message: dict):
+        await self.broadcast_text(json.dumps(message, separators=(",", ":"), ensure_ascii=False))
+
+    async def broadcast_text(self, payload: str):
+        """Send an already serialized JSON message to every client."""
         disconnected = []
         for connection in self.active_connections:
             try:
-                await connection.send_json(message)
+                await connection.send_text(payload)
             except Exception as e:
                 logger.error(f"Error sending message to WebSocket: {e}")
                 disconnected.append(connection)
@@ -68,6 +74,14 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+def dumps_json(data) -> str:
+    """Serialize to JSON with the C encoder, using FastAPI's encoder only for non-JSON types."""
+    return json.dumps(data, default=jsonable_encoder, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+def json_response(data) -> Response:
+    """Build a JSON response without walking the payload through jsonable_encoder."""
+    return Response(content=dumps_json(data), media_type="application/json")
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize all ship safety systems and database on startup."""
@@ -81,7 +95,7 @@ async def startup_event():
     
     # Initialize all safety systems
     emergency_stop = EmergencyStopSystem()
-    fire_detection = FireDetectionSystem()
+    fire_detection = FireDetectionSystem(journal_path="logs/fire_alarm_journal.jsonl")
     cctv_system = CCTVSystem()
     paga_system = PAGASystem()
     communication = CommunicationSystem()
@@ -116,6 +130,9 @@ async def shutdown_event():
     if safety_manager:
         await safety_manager.shutdown()
     logger.info("🛑 Ship Safety System Integration Platform shutdown complete")
+    
+    # Wait for queued log records to reach the file sinks
+    await logger.complete()
 
 @app.get("/", response_class=HTMLResponse)
 async def dashboard(request: Request):
@@ -128,7 +145,7 @@ async def get_system_status():
     if not safety_manager:
         return {"error": "Systems not initialized"}
     
-    return await safety_manager.get_system_status()
+    return json_response(await safety_manager.get_system_status())
 
 @app.get("/api/system/events")
 async def get_recent_events():
@@ -136,7 +153,7 @@ async def get_recent_events():
     if not safety_manager:
         return {"error": "Systems not initialized"}
     
-    return await safety_manager.get_recent_events()
+    return json_response(await safety_manager.get_recent_events())
 
 @app.get("/api/compliance/status")
 async def get_compliance_status():
@@ -144,7 +161,7 @@ async def get_compliance_status():
     if not safety_manager:
         return {"error": "Systems not initialized"}
     
-    return await safety_manager.get_compliance_status()
+    return json_response(await safety_manager.get_compliance_status())
 
 @app.post("/api/emergency/stop")
 async def trigger_emergency_stop():
@@ -189,7 +206,7 @@ async def websocket_endpoint(websocket: WebSocket):
             # Echo back system status if requested
             if data == "get_status" and safety_manager:
                 status = await safety_manager.get_system_status()
-                await websocket.send_json({"type": "status_update", "data": status})
+                await websocket.send_text(dumps_json({"type": "status_update", "data": status}))
                 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -208,5 +225,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
+        loop="auto",  # uvloop when installed, otherwise the stdlib asyncio loop
         log_level="info"
     ) 
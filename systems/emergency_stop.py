@@ -11,9 +11,11 @@ This system demonstrates understanding of:
 
 import asyncio
 import json
-from datetime import datetime
-from typing import Dict, List, Optional
-from enum import Enum
+import time
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
+from enum import Enum, IntEnum
 
 from loguru import logger
 from database.models import SystemType, SystemStatus, EventSeverity
@@ -26,6 +28,59 @@ class EmergencyStopZone(str, Enum):
     PROPULSION = "propulsion"
     ALL_ZONES = "all_zones"
 
+class MachineStatus(IntEnum):
+    RUNNING = 1
+    STANDBY = 2
+    EMERGENCY_STOP = 3
+    STOPPED = 4
+
+# Zones that own machinery, i.e. every zone except the ALL_ZONES selector
+_MACHINERY_ZONES = tuple(zone for zone in EmergencyStopZone if zone != EmergencyStopZone.ALL_ZONES)
+
+
+# Static emergency reference data, shared read-only across all instances
+_EMERGENCY_PROCEDURES = MappingProxyType({
+    "procedures": MappingProxyType({
+        "engine_room_fire": (
+            "1. Activate emergency stop for engine room",
+            "2. Activate fire suppression system",
+            "3. Evacuate personnel from engine room",
+            "4. Notify bridge and emergency team",
+            "5. Prepare emergency power systems"
+        ),
+        "flooding": (
+            "1. Activate emergency stop for affected areas",
+            "2. Activate bilge pumps",
+            "3. Close watertight doors",
+            "4. Sound general alarm",
+            "5. Prepare lifeboats if necessary"
+        ),
+        "collision": (
+            "1. Emergency stop all machinery",
+            "2. Assess damage and flooding",
+            "3. Sound emergency signals",
+            "4. Contact coast guard",
+            "5. Prepare for evacuation if necessary"
+        )
+    }),
+    "emergency_contacts": (
+        MappingProxyType({"role": "Master", "location": "Bridge", "priority": 1}),
+        MappingProxyType({"role": "Chief Engineer", "location": "Engine Control Room", "priority": 2}),
+        MappingProxyType({"role": "Safety Officer", "location": "Safety Station", "priority": 3}),
+        MappingProxyType({"role": "Coast Guard", "frequency": "VHF Ch 16", "priority": 1})
+    ),
+    "system_integration": MappingProxyType({
+        "fire_detection": "Auto-trigger on fire alarm",
+        "paga_system": "Auto-announcement of emergency stop",
+        "cctv_system": "Auto-focus on emergency zones",
+        "communication": "Auto-notify emergency contacts"
+    })
+})
+
+def _ns_to_iso(timestamp_ns: int) -> str:
+    """Format a time.time_ns() capture as an ISO-8601 UTC timestamp."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).isoformat()
+
 class EmergencyStopSystem:
     """
     Emergency Stop System for ship safety.
@@ -34,15 +89,35 @@ class EmergencyStopSystem:
     with coordinated response across all ship systems.
     """
     
+    __slots__ = (
+        "system_type", "status", "active_stops", "zone_status", "machinery_status",
+        "last_test", "emergency_contacts", "integration_callbacks",
+        "_stopped_record", "_log_queue", "_log_task", "_state_version", "_zone_counts"
+    )
+    
     def __init__(self):
         self.system_type = SystemType.EMERGENCY_STOP
         self.status = SystemStatus.NORMAL
         self.active_stops = set()
         self.zone_status = {zone: False for zone in EmergencyStopZone}
         self.machinery_status = self._initialize_machinery()
+        assert all(zone in self.machinery_status for zone in _MACHINERY_ZONES)
         self.last_test = None
         self.emergency_contacts = []
-        self.integration_callbacks = []
+        # Immutable snapshot, replaced on registration so in-flight
+        # notifications keep iterating the callbacks they started with
+        self.integration_callbacks = ()
+        # Machinery actually halted by each zone's emergency stop, so reset
+        # only revisits what was stopped rather than the whole zone
+        self._stopped_record: Dict[EmergencyStopZone, List[str]] = {}
+        # Event logging runs in a background task so emergency actions
+        # return as soon as machinery state has been updated
+        self._log_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+        self._log_task: Optional[asyncio.Task] = None
+        # Bumped on every state change so pollers can skip unchanged status
+        self._state_version = 0
+        # Per-zone machinery counters, kept current on every status change
+        self._zone_counts = self._initialize_zone_counts()
         
         logger.info("🚨 Emergency Stop System initialized")
     
@@ -50,40 +125,54 @@ class EmergencyStopSystem:
         """Initialize machinery configuration for each zone."""
         return {
             EmergencyStopZone.ENGINE_ROOM: {
-                "main_engine": {"status": "running", "critical": True},
-                "auxiliary_engine": {"status": "running", "critical": False},
-                "fuel_pumps": {"status": "running", "critical": True},
-                "cooling_system": {"status": "running", "critical": True},
-                "oil_pumps": {"status": "running", "critical": True}
+                "main_engine": {"status": MachineStatus.RUNNING, "critical": True},
+                "auxiliary_engine": {"status": MachineStatus.RUNNING, "critical": False},
+                "fuel_pumps": {"status": MachineStatus.RUNNING, "critical": True},
+                "cooling_system": {"status": MachineStatus.RUNNING, "critical": True},
+                "oil_pumps": {"status": MachineStatus.RUNNING, "critical": True}
             },
             EmergencyStopZone.DECK_MACHINERY: {
-                "crane": {"status": "standby", "critical": False},
-                "winch": {"status": "standby", "critical": False},
-                "anchor_windlass": {"status": "standby", "critical": False},
-                "deck_lights": {"status": "running", "critical": False}
+                "crane": {"status": MachineStatus.STANDBY, "critical": False},
+                "winch": {"status": MachineStatus.STANDBY, "critical": False},
+                "anchor_windlass": {"status": MachineStatus.STANDBY, "critical": False},
+                "deck_lights": {"status": MachineStatus.RUNNING, "critical": False}
             },
             EmergencyStopZone.VENTILATION: {
-                "engine_room_fans": {"status": "running", "critical": True},
-                "accommodation_hvac": {"status": "running", "critical": False},
-                "cargo_ventilation": {"status": "running", "critical": False},
-                "galley_exhaust": {"status": "running", "critical": False}
+                "engine_room_fans": {"status": MachineStatus.RUNNING, "critical": True},
+                "accommodation_hvac": {"status": MachineStatus.RUNNING, "critical": False},
+                "cargo_ventilation": {"status": MachineStatus.RUNNING, "critical": False},
+                "galley_exhaust": {"status": MachineStatus.RUNNING, "critical": False}
             },
             EmergencyStopZone.ELECTRICAL: {
-                "main_generator": {"status": "running", "critical": True},
-                "emergency_generator": {"status": "standby", "critical": True},
-                "lighting_circuits": {"status": "running", "critical": False},
-                "navigation_power": {"status": "running", "critical": True}
+                "main_generator": {"status": MachineStatus.RUNNING, "critical": True},
+                "emergency_generator": {"status": MachineStatus.STANDBY, "critical": True},
+                "lighting_circuits": {"status": MachineStatus.RUNNING, "critical": False},
+                "navigation_power": {"status": MachineStatus.RUNNING, "critical": True}
             },
             EmergencyStopZone.PROPULSION: {
-                "main_propulsion": {"status": "running", "critical": True},
-                "bow_thruster": {"status": "standby", "critical": False},
-                "steering_gear": {"status": "running", "critical": True}
+                "main_propulsion": {"status": MachineStatus.RUNNING, "critical": True},
+                "bow_thruster": {"status": MachineStatus.STANDBY, "critical": False},
+                "steering_gear": {"status": MachineStatus.RUNNING, "critical": True}
             }
         }
     
+    def _initialize_zone_counts(self) -> Dict[EmergencyStopZone, Dict[str, int]]:
+        """Build running/stopped machinery counters for each zone."""
+        zone_counts = {}
+        for zone, zone_machinery in self.machinery_status.items():
+            counts = {"running": 0, "stopped": 0, "critical_stopped": 0}
+            for config in zone_machinery.values():
+                if config["status"] is MachineStatus.RUNNING:
+                    counts["running"] += 1
+                elif config["status"] in (MachineStatus.EMERGENCY_STOP, MachineStatus.STOPPED):
+                    counts["stopped"] += 1
+                    counts["critical_stopped"] += config["critical"]
+            zone_counts[zone] = counts
+        return zone_counts
+    
     async def register_integration_callback(self, callback):
         """Register callback for system integration."""
-        self.integration_callbacks.append(callback)
+        self.integration_callbacks = self.integration_callbacks + (callback,)
         logger.debug(f"Integration callback registered: {callback.__name__}")
     
     async def trigger_emergency_stop(self, zone: EmergencyStopZone = EmergencyStopZone.ALL_ZONES,
@@ -98,31 +187,43 @@ class EmergencyStopSystem:
         Returns:
             Dict with operation result and affected systems
         """
-        logger.critical(f"🚨 EMERGENCY STOP TRIGGERED - Zone: {zone.value}, Reason: {reason}")
+        timestamp_ns = time.time_ns()
+        zone_name = zone.value
+        logger.critical(f"🚨 EMERGENCY STOP TRIGGERED - Zone: {zone_name}, Reason: {reason}")
         
         # Update system status
         self.status = SystemStatus.EMERGENCY
         self.active_stops.add(zone)
+        self._state_version += 1
         
         # Shutdown machinery in affected zones
         affected_machinery = []
-        shutdown_zones = [zone] if zone != EmergencyStopZone.ALL_ZONES else list(EmergencyStopZone)[:-1]
+        shutdown_zones = (zone,) if zone != EmergencyStopZone.ALL_ZONES else _MACHINERY_ZONES
         
         for stop_zone in shutdown_zones:
-            if stop_zone in self.machinery_status:
-                self.zone_status[stop_zone] = True
-                for machinery, config in self.machinery_status[stop_zone].items():
-                    if config["status"] == "running":
-                        config["status"] = "emergency_stop"
-                        affected_machinery.append(f"{stop_zone.value}:{machinery}")
-                        logger.warning(f"🛑 Emergency stop: {stop_zone.value} - {machinery}")
+            self.zone_status[stop_zone] = True
+            stopped = self._stopped_record.setdefault(stop_zone, [])
+            counts = self._zone_counts[stop_zone]
+            stop_zone_name = stop_zone.value
+            prefix = stop_zone_name + ":"
+            for machinery, config in self.machinery_status[stop_zone].items():
+                if config["status"] is MachineStatus.RUNNING:
+                    config["status"] = MachineStatus.EMERGENCY_STOP
+                    counts["running"] -= 1
+                    counts["stopped"] += 1
+                    counts["critical_stopped"] += config["critical"]
+                    stopped.append(machinery)
+                    affected_machinery.append(prefix + machinery)
+                    logger.warning("🛑 Emergency stop: {} - {}", stop_zone_name, machinery)
         
         # Create emergency event record
+        timestamp = _ns_to_iso(timestamp_ns)
         event_data = {
-            "zone": zone.value,
+            "zone": zone_name,
             "reason": reason,
             "affected_machinery": affected_machinery,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
+            "timestamp_ns": timestamp_ns,
             "operator": "system"
         }
         
@@ -133,16 +234,16 @@ class EmergencyStopSystem:
         await self._log_event(
             event_type="EMERGENCY_STOP_ACTIVATED",
             severity=EventSeverity.EMERGENCY,
-            message=f"Emergency stop activated for {zone.value}. Reason: {reason}",
+            message=f"Emergency stop activated for {zone_name}. Reason: {reason}",
             additional_data=json.dumps(event_data)
         )
         
         return {
             "success": True,
-            "zone": zone.value,
+            "zone": zone_name,
             "reason": reason,
             "affected_machinery": affected_machinery,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "status": "emergency_stop_active"
         }
     
@@ -156,28 +257,37 @@ class EmergencyStopSystem:
         Returns:
             Dict with reset operation result
         """
-        logger.info(f"🔄 Resetting emergency stop for zone: {zone.value}")
+        zone_name = zone.value
+        logger.info(f"🔄 Resetting emergency stop for zone: {zone_name}")
+        timestamp_ns = time.time_ns()
         
         # Remove from active stops
         if zone in self.active_stops:
             self.active_stops.remove(zone)
+        self._state_version += 1
         
         # Reset machinery in affected zones
         reset_machinery = []
-        reset_zones = [zone] if zone != EmergencyStopZone.ALL_ZONES else list(EmergencyStopZone)[:-1]
+        reset_zones = (zone,) if zone != EmergencyStopZone.ALL_ZONES else _MACHINERY_ZONES
         
         for reset_zone in reset_zones:
-            if reset_zone in self.machinery_status:
-                self.zone_status[reset_zone] = False
-                for machinery, config in self.machinery_status[reset_zone].items():
-                    if config["status"] == "emergency_stop":
-                        # Only restart non-critical machinery automatically
-                        if not config["critical"]:
-                            config["status"] = "running"
-                            reset_machinery.append(f"{reset_zone.value}:{machinery}")
-                        else:
-                            config["status"] = "stopped"  # Critical machinery requires manual restart
-                            logger.warning(f"⚠️ Critical machinery requires manual restart: {reset_zone.value} - {machinery}")
+            self.zone_status[reset_zone] = False
+            zone_machinery = self.machinery_status[reset_zone]
+            counts = self._zone_counts[reset_zone]
+            reset_zone_name = reset_zone.value
+            prefix = reset_zone_name + ":"
+            for machinery in self._stopped_record.pop(reset_zone, ()):
+                config = zone_machinery[machinery]
+                if config["status"] is MachineStatus.EMERGENCY_STOP:
+                    # Only restart non-critical machinery automatically
+                    if not config["critical"]:
+                        config["status"] = MachineStatus.RUNNING
+                        counts["running"] += 1
+                        counts["stopped"] -= 1
+                        reset_machinery.append(prefix + machinery)
+                    else:
+                        config["status"] = MachineStatus.STOPPED  # Critical machinery requires manual restart
+                        logger.warning("⚠️ Critical machinery requires manual restart: {} - {}", reset_zone_name, machinery)
         
         # Update system status if no active stops
         if not self.active_stops:
@@ -185,10 +295,12 @@ class EmergencyStopSystem:
             logger.info("✅ All emergency stops cleared - System returned to normal")
         
         # Create reset event record
+        timestamp = _ns_to_iso(timestamp_ns)
         event_data = {
-            "zone": zone.value,
+            "zone": zone_name,
             "reset_machinery": reset_machinery,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
+            "timestamp_ns": timestamp_ns,
             "remaining_stops": list(self.active_stops)
         }
         
@@ -199,15 +311,15 @@ class EmergencyStopSystem:
         await self._log_event(
             event_type="EMERGENCY_STOP_RESET",
             severity=EventSeverity.INFO,
-            message=f"Emergency stop reset for {zone.value}",
+            message=f"Emergency stop reset for {zone_name}",
             additional_data=json.dumps(event_data)
         )
         
         return {
             "success": True,
-            "zone": zone.value,
+            "zone": zone_name,
             "reset_machinery": reset_machinery,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "system_status": self.status.value,
             "active_stops": list(self.active_stops)
         }
@@ -219,23 +331,34 @@ class EmergencyStopSystem:
             "status": self.status.value,
             "active_stops": list(self.active_stops),
             "zone_status": {zone.value: status for zone, status in self.zone_status.items()},
-            "machinery_status": self.machinery_status,
+            "machinery_status": {
+                zone: {
+                    machinery: {"status": config["status"].name.lower(), "critical": config["critical"]}
+                    for machinery, config in zone_machinery.items()
+                }
+                for zone, zone_machinery in self.machinery_status.items()
+            },
             "last_test": self.last_test.isoformat() if self.last_test else None,
-            "performance_score": self._calculate_performance_score()
+            "performance_score": self._calculate_performance_score(),
+            "state_version": self._state_version
         }
     
+    async def get_state_version(self) -> int:
+        """Get the state version, which changes whenever system state does."""
+        return self._state_version
+    
     async def perform_system_test(self) -> Dict:
         """Perform emergency stop system test."""
         logger.info("🧪 Performing emergency stop system test")
         
         self.last_test = datetime.utcnow()
+        self._state_version += 1
         test_results = {}
         
         # Test each zone's emergency stop capability
-        for zone in EmergencyStopZone:
-            if zone == EmergencyStopZone.ALL_ZONES:
-                continue
-                
+        for zone in _MACHINERY_ZONES:
+            counts = self._zone_counts[zone]
+            
             # Simulate test - check response time and functionality
             response_time = 0.15  # Simulated response time in seconds
             test_passed = response_time < 0.5  # Should respond within 500ms
@@ -243,7 +366,10 @@ class EmergencyStopSystem:
             test_results[zone.value] = {
                 "passed": test_passed,
                 "response_time": response_time,
-                "status": "OK" if test_passed else "FAIL"
+                "status": "OK" if test_passed else "FAIL",
+                "running_machinery": counts["running"],
+                "stopped_machinery": counts["stopped"],
+                "critical_stopped": counts["critical_stopped"]
             }
         
         # Log test event
@@ -263,25 +389,23 @@ class EmergencyStopSystem:
     
     def _calculate_performance_score(self) -> float:
         """Calculate system performance score."""
-        base_score = 100.0
-        
-        # Reduce score for active emergency stops
-        if self.active_stops:
-            base_score -= len(self.active_stops) * 20
+        # Each active emergency stop costs 20 points
+        stops_penalty = len(self.active_stops) * 20
         
-        # Reduce score if last test was too long ago
-        if self.last_test:
-            days_since_test = (datetime.utcnow() - self.last_test).days
-            if days_since_test > 30:
-                base_score -= min(days_since_test - 30, 50)
+        # Untested systems lose 30 points; otherwise lose a point per day
+        # beyond the 30-day test interval, capped at 50
+        if self.last_test is None:
+            test_penalty = 30
         else:
-            base_score -= 30  # No test performed
+            days_since_test = (datetime.utcnow() - self.last_test).days
+            test_penalty = min(max(days_since_test - 30, 0), 50)
         
-        return max(0, base_score)
+        return max(0.0, 100.0 - stops_penalty - test_penalty)
     
     async def _notify_integrated_systems(self, event_type: str, data: Dict):
         """Notify other systems of emergency stop events."""
-        for callback in self.integration_callbacks:
+        callbacks = self.integration_callbacks
+        for callback in callbacks:
             try:
                 await callback(self.system_type, event_type, data)
             except Exception as e:
@@ -289,46 +413,46 @@ class EmergencyStopSystem:
     
     async def _log_event(self, event_type: str, severity: EventSeverity, 
                         message: str, location: str = None, additional_data: str = None):
-        """Log system event to database."""
-        # This would be implemented with actual database logging
-        logger.info(f"Event logged: {event_type} - {message}")
+        """Queue system event for background logging to database."""
+        if self._log_task is None:
+            self._log_task = asyncio.create_task(self._log_consumer())
         
-    async def get_emergency_procedures(self) -> Dict:
+        try:
+            self._log_queue.put_nowait({
+                "event_type": event_type,
+                "severity": severity,
+                "message": message,
+                "location": location,
+                "additional_data": additional_data
+            })
+        except asyncio.QueueFull:
+            logger.warning(f"Event log queue full - dropping event: {event_type}")
+    
+    async def _log_consumer(self):
+        """Background task writing queued events off the emergency path."""
+        while True:
+            event = await self._log_queue.get()
+            try:
+                # This would be implemented with actual database logging
+                logger.info(f"Event logged: {event['event_type']} - {event['message']}")
+            except Exception as e:
+                logger.error(f"Error logging event: {e}")
+            finally:
+                self._log_queue.task_done()
+    
+    async def aclose(self):
+        """Drain pending event logs and stop the background logger."""
+        if self._log_task is None:
+            return
+        
+        await self._log_queue.join()
+        self._log_task.cancel()
+        try:
+            await self._log_task
+        except asyncio.CancelledError:
+            pass
+        self._log_task = None
+        
+    async def get_emergency_procedures(self) -> Mapping:
         """Get emergency procedures and contact information."""
-        return {
-            "procedures": {
-                "engine_room_fire": [
-                    "1. Activate emergency stop for engine room",
-                    "2. Activate fire suppression system",
-                    "3. Evacuate personnel from engine room",
-                    "4. Notify bridge and emergency team",
-                    "5. Prepare emergency power systems"
-                ],
-                "flooding": [
-                    "1. Activate emergency stop for affected areas",
-                    "2. Activate bilge pumps",
-                    "3. Close watertight doors",
-                    "4. Sound general alarm",
-                    "5. Prepare lifeboats if necessary"
-                ],
-                "collision": [
-                    "1. Emergency stop all machinery",
-                    "2. Assess damage and flooding",
-                    "3. Sound emergency signals",
-                    "4. Contact coast guard",
-                    "5. Prepare for evacuation if necessary"
-                ]
-            },
-            "emergency_contacts": [
-                {"role": "Master", "location": "Bridge", "priority": 1},
-                {"role": "Chief Engineer", "location": "Engine Control Room", "priority": 2},
-                {"role": "Safety Officer", "location": "Safety Station", "priority": 3},
-                {"role": "Coast Guard", "frequency": "VHF Ch 16", "priority": 1}
-            ],
-            "system_integration": {
-                "fire_detection": "Auto-trigger on fire alarm",
-                "paga_system": "Auto-announcement of emergency stop",
-                "cctv_system": "Auto-focus on emergency zones",
-                "communication": "Auto-notify emergency contacts"
-            }
-        } 
\ No newline at end of file
+        return _EMERGENCY_PROCEDURES
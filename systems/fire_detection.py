@@ -12,13 +12,21 @@ This system demonstrates understanding of:
 
 import asyncio
 import json
-import random
+import os
+import sys
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import partial
+from pathlib import Path
+from types import MappingProxyType
+from typing import Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+from dataclasses import asdict, dataclass
 from enum import Enum
 
+import numpy as np
 from loguru import logger
 from database.models import SystemType, SystemStatus, EventSeverity
+from utils.deadline_scheduler import DeadlineScheduler
 
 class FireDetectorType(str, Enum):
     SMOKE = "smoke"
@@ -33,6 +41,101 @@ class AlarmLevel(str, Enum):
     FIRE_ALARM = "fire_alarm"
     CRITICAL = "critical"
 
+# Enum members used on the alarm paths, bound once at module level
+_NORMAL = AlarmLevel.NORMAL
+_FIRE_ALARM = AlarmLevel.FIRE_ALARM
+_SEV_INFO = EventSeverity.INFO
+_SEV_CRIT = EventSeverity.CRITICAL
+
+@dataclass(slots=True)
+class FireZone:
+    name: str
+    deck_level: str
+    priority: str
+    alarm_level: AlarmLevel
+    temperature: float  # °C
+    smoke_level: float  # ppm
+    gas_level: float  # ppm
+    suppression_type: str
+    evacuation_time: int  # seconds
+    personnel_count: int
+    last_alarm: Optional[datetime]
+
+@dataclass(slots=True)
+class FireDetector:
+    id: str
+    type: FireDetectorType
+    status: str
+    threshold: float
+
+@dataclass(slots=True)
+class Alarm:
+    zone: str
+    detector_id: Optional[str]
+    cause: str
+    start_time: datetime  # wall clock, for event payloads
+    start_ns: int  # monotonic, for durations
+    level: AlarmLevel
+    suppression_activated: bool = False
+    evacuation_ordered: bool = False
+
+@dataclass(slots=True)
+class SuppressionSystem:
+    type: str
+    status: str
+    pressure: float  # bar
+    capacity: float  # kg or liters
+    discharge_time: int  # seconds
+    last_test: Optional[datetime]
+
+# Simulated sensor columns and their per-tick variation, valid range and
+# minimum change before a reading is published as an event
+_SENSORS = ("temperature", "smoke_level", "gas_level")
+_SENSOR_STEPS = np.array([0.5, 0.05, 0.01], dtype=np.float32)
+_SENSOR_MIN = np.array([10.0, 0.0, 0.0], dtype=np.float32)
+_SENSOR_MAX = np.array([60.0, 10.0, 100.0], dtype=np.float32)
+_SENSOR_DELTAS = np.array([1.0, 0.1, 0.05], dtype=np.float32)
+_SENSOR_INDEX = {sensor: i for i, sensor in enumerate(_SENSORS)}
+
+# Detector types that read each simulated sensor column; flame and
+# multi-sensor detectors have no simulated reading (-1)
+_DETECTOR_SENSOR = {
+    FireDetectorType.HEAT: _SENSOR_INDEX["temperature"],
+    FireDetectorType.SMOKE: _SENSOR_INDEX["smoke_level"],
+    FireDetectorType.GAS: _SENSOR_INDEX["gas_level"]
+}
+_DETECTOR_ACTIVE = 1
+_DETECTOR_FAULT = 0
+
+# Upper bound on reset Alarm records kept for reuse
+_ALARM_POOL_SIZE = 32
+
+# Seconds the journal writer waits to batch entries into one fsync
+_JOURNAL_FLUSH_INTERVAL = 0.05
+
+# Seconds sensor updates are coalesced before one batched integration notification
+_SENSOR_NOTIFY_INTERVAL = 0.25
+
+def _sensor_tick(readings, steps, zone_normal, published):
+    """
+    Advance simulated sensor readings in place.
+    
+    Applies the random-walk steps to zones not in alarm and clamps readings
+    to their valid ranges. Detector thresholds are not evaluated here; they
+    are checked per zone when real readings are applied.
+    
+    Returns:
+        Mask of readings that moved by more than the publish delta
+    """
+    steps[~zone_normal] = 0.0
+    readings += steps
+    np.clip(readings, _SENSOR_MIN, _SENSOR_MAX, out=readings)
+    return np.abs(readings - published) >= _SENSOR_DELTAS
+
+def _frozen_view(sections: Dict[str, Dict]) -> Mapping[str, Mapping]:
+    """Wrap a dict of dicts in read-only views at both levels."""
+    return MappingProxyType({key: MappingProxyType(value) for key, value in sections.items()})
+
 class FireDetectionSystem:
     """
     Fire Detection System for ship safety.
@@ -41,172 +144,270 @@ class FireDetectionSystem:
     and integration with other ship safety systems.
     """
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None, journal_path: Optional[str] = None,
+                 max_concurrent_notifications: int = 8):
         self.system_type = SystemType.FIRE_DETECTION
         self.status = SystemStatus.NORMAL
         self.zones = self._initialize_fire_zones()
+        # Alarm id prefix per zone, computed once rather than on every alarm
+        self._zone_upper = {zone: sys.intern(zone.upper()) for zone in self.zones}
+        # Zone response actions are fixed per zone, so build them once with
+        # placeholders for the values filled in when an alarm is raised
+        self._response_templates = {
+            zone: self._build_response_template(zone, zone_data) for zone, zone_data in self.zones.items()
+        }
         self.detectors = self._initialize_detectors()
-        self.active_alarms = {}
+        # Detector health counters, maintained by _set_detector_status
+        self._active_counts = {
+            zone: sum(1 for d in detectors if d.status == "active")
+            for zone, detectors in self.detectors.items()
+        }
+        self._faulty_count = sum(
+            len(detectors) - self._active_counts[zone] for zone, detectors in self.detectors.items()
+        )
+        self.active_alarms: Dict[str, Alarm] = {}
+        # Active alarm id per zone, so repeated triggers collapse onto one alarm
+        self._zone_to_alarm: Dict[str, str] = {}
+        # Reset alarm records recycled by trigger_fire_alarm, one per zone up front
+        self._alarm_pool: List[Alarm] = [
+            Alarm("", None, "", datetime.min, 0, _NORMAL) for _ in self.zones
+        ]
         self.suppression_systems = self._initialize_suppression()
         self.last_test = None
-        self.integration_callbacks = []
+        # Status snapshot reused across polls; cleared by every state change
+        self._status_cache: Optional[Dict] = None
+        self.integration_callbacks = set()
+        # Subscribers to routine sensor telemetry, kept apart from safety events
+        self.telemetry_callbacks = set()
+        # Caps how many integration callbacks run at once per notification
+        self._notify_sem = asyncio.Semaphore(max_concurrent_notifications)
+        # Sensor readings are pushed here by drivers or the simulator and
+        # applied by the monitoring loop as they arrive
+        self._event_q: asyncio.Queue = asyncio.Queue()
+        # Latest applied reading per (zone, sensor) awaiting the next telemetry
+        # batch; keyed so it stays bounded when nothing drains it
+        self._pending_notify: Dict[Tuple[str, str], Dict] = {}
+        # Simulated physical readings as one row per zone and one column per
+        # sensor, plus the values last published to the monitoring loop
+        self._zone_names = tuple(self.zones)
+        self._zone_index = {zone: i for i, zone in enumerate(self._zone_names)}
+        self._readings = np.array(
+            [[getattr(zone_data, sensor) for sensor in _SENSORS] for zone_data in self.zones.values()],
+            dtype=np.float32
+        )
+        self._published = self._readings.copy()
+        self._zone_normal = np.ones(len(self._zone_names), dtype=bool)
+        # Instance generator for sensor simulation and detector tests; pass
+        # a seed for reproducible runs
+        self._rng = np.random.default_rng(seed)
+        # Flat detector table in zone order, mirroring self.detectors
+        self._build_detector_table()
+        # Suppression and recharge timers share one deadline worker task
+        self._timers = DeadlineScheduler("fire system")
+        # Append-only journal of alarm transitions, replayed on start so
+        # active alarms and pending suppression survive a restart
+        self._journal_path = Path(journal_path) if journal_path else None
+        self._journal_q: asyncio.Queue = asyncio.Queue()
+        self._journal_task: Optional[asyncio.Task] = None
+        self._journal_seq = 0
+        # Suppression delays still owed by replayed alarms, scheduled by
+        # resume_suppression_timers once an event loop is running
+        self._pending_suppression: Dict[str, float] = {}
+        if self._journal_path is not None:
+            self._replay_journal()
         
         logger.info("🔥 Fire Detection System initialized")
     
-    def _initialize_fire_zones(self) -> Dict[str, Dict]:
+    def _initialize_fire_zones(self) -> Dict[str, FireZone]:
         """Initialize fire detection zones with maritime standards compliance."""
         return {
-            "engine_room": {
-                "name": "Engine Room",
-                "deck_level": "Lower Deck",
-                "priority": "critical",
-                "alarm_level": AlarmLevel.NORMAL,
-                "temperature": 45.0,  # °C
-                "smoke_level": 0.1,   # ppm
-                "gas_level": 0.0,     # ppm
-                "suppression_type": "CO2",
-                "evacuation_time": 120,  # seconds
-                "personnel_count": 2,
-                "last_alarm": None
-            },
-            "bridge": {
-                "name": "Bridge",
-                "deck_level": "Upper Deck",
-                "priority": "critical",
-                "alarm_level": AlarmLevel.NORMAL,
-                "temperature": 22.0,
-                "smoke_level": 0.0,
-                "gas_level": 0.0,
-                "suppression_type": "Water Mist",
-                "evacuation_time": 60,
-                "personnel_count": 3,
-                "last_alarm": None
-            },
-            "crew_quarters": {
-                "name": "Crew Quarters",
-                "deck_level": "Main Deck",
-                "priority": "high",
-                "alarm_level": AlarmLevel.NORMAL,
-                "temperature": 20.0,
-                "smoke_level": 0.0,
-                "gas_level": 0.0,
-                "suppression_type": "Sprinkler",
-                "evacuation_time": 180,
-                "personnel_count": 8,
-                "last_alarm": None
-            },
-            "cargo_hold": {
-                "name": "Cargo Hold",
-                "deck_level": "Lower Deck",
-                "priority": "high",
-                "alarm_level": AlarmLevel.NORMAL,
-                "temperature": 25.0,
-                "smoke_level": 0.0,
-                "gas_level": 0.0,
-                "suppression_type": "Foam",
-                "evacuation_time": 300,
-                "personnel_count": 0,
-                "last_alarm": None
-            },
-            "galley": {
-                "name": "Galley",
-                "deck_level": "Main Deck",
-                "priority": "medium",
-                "alarm_level": AlarmLevel.NORMAL,
-                "temperature": 35.0,
-                "smoke_level": 0.2,
-                "gas_level": 0.0,
-                "suppression_type": "Wet Chemical",
-                "evacuation_time": 90,
-                "personnel_count": 2,
-                "last_alarm": None
-            }
+            "engine_room": FireZone(
+                name="Engine Room",
+                deck_level="Lower Deck",
+                priority="critical",
+                alarm_level=_NORMAL,
+                temperature=45.0,  # °C
+                smoke_level=0.1,   # ppm
+                gas_level=0.0,     # ppm
+                suppression_type="CO2",
+                evacuation_time=120,  # seconds
+                personnel_count=2,
+                last_alarm=None
+            ),
+            "bridge": FireZone(
+                name="Bridge",
+                deck_level="Upper Deck",
+                priority="critical",
+                alarm_level=_NORMAL,
+                temperature=22.0,
+                smoke_level=0.0,
+                gas_level=0.0,
+                suppression_type="Water Mist",
+                evacuation_time=60,
+                personnel_count=3,
+                last_alarm=None
+            ),
+            "crew_quarters": FireZone(
+                name="Crew Quarters",
+                deck_level="Main Deck",
+                priority="high",
+                alarm_level=_NORMAL,
+                temperature=20.0,
+                smoke_level=0.0,
+                gas_level=0.0,
+                suppression_type="Sprinkler",
+                evacuation_time=180,
+                personnel_count=8,
+                last_alarm=None
+            ),
+            "cargo_hold": FireZone(
+                name="Cargo Hold",
+                deck_level="Lower Deck",
+                priority="high",
+                alarm_level=_NORMAL,
+                temperature=25.0,
+                smoke_level=0.0,
+                gas_level=0.0,
+                suppression_type="Foam",
+                evacuation_time=300,
+                personnel_count=0,
+                last_alarm=None
+            ),
+            "galley": FireZone(
+                name="Galley",
+                deck_level="Main Deck",
+                priority="medium",
+                alarm_level=_NORMAL,
+                temperature=35.0,
+                smoke_level=0.2,
+                gas_level=0.0,
+                suppression_type="Wet Chemical",
+                evacuation_time=90,
+                personnel_count=2,
+                last_alarm=None
+            )
         }
     
-    def _initialize_detectors(self) -> Dict[str, List[Dict]]:
+    def _initialize_detectors(self) -> Dict[str, List[FireDetector]]:
         """Initialize fire detectors for each zone."""
         return {
             "engine_room": [
-                {"id": "FD-ER-001", "type": FireDetectorType.HEAT, "status": "active", "threshold": 80.0},
-                {"id": "FD-ER-002", "type": FireDetectorType.SMOKE, "status": "active", "threshold": 5.0},
-                {"id": "FD-ER-003", "type": FireDetectorType.GAS, "status": "active", "threshold": 50.0},
-                {"id": "FD-ER-004", "type": FireDetectorType.FLAME, "status": "active", "threshold": 0.5},
-                {"id": "FD-ER-005", "type": FireDetectorType.MULTI_SENSOR, "status": "active", "threshold": 0.3}
+                FireDetector(id="FD-ER-001", type=FireDetectorType.HEAT, status="active", threshold=80.0),
+                FireDetector(id="FD-ER-002", type=FireDetectorType.SMOKE, status="active", threshold=5.0),
+                FireDetector(id="FD-ER-003", type=FireDetectorType.GAS, status="active", threshold=50.0),
+                FireDetector(id="FD-ER-004", type=FireDetectorType.FLAME, status="active", threshold=0.5),
+                FireDetector(id="FD-ER-005", type=FireDetectorType.MULTI_SENSOR, status="active", threshold=0.3)
             ],
             "bridge": [
-                {"id": "FD-BR-001", "type": FireDetectorType.SMOKE, "status": "active", "threshold": 2.0},
-                {"id": "FD-BR-002", "type": FireDetectorType.HEAT, "status": "active", "threshold": 60.0},
-                {"id": "FD-BR-003", "type": FireDetectorType.MULTI_SENSOR, "status": "active", "threshold": 0.2}
+                FireDetector(id="FD-BR-001", type=FireDetectorType.SMOKE, status="active", threshold=2.0),
+                FireDetector(id="FD-BR-002", type=FireDetectorType.HEAT, status="active", threshold=60.0),
+                FireDetector(id="FD-BR-003", type=FireDetectorType.MULTI_SENSOR, status="active", threshold=0.2)
             ],
             "crew_quarters": [
-                {"id": "FD-CQ-001", "type": FireDetectorType.SMOKE, "status": "active", "threshold": 3.0},
-                {"id": "FD-CQ-002", "type": FireDetectorType.SMOKE, "status": "active", "threshold": 3.0},
-                {"id": "FD-CQ-003", "type": FireDetectorType.HEAT, "status": "active", "threshold": 65.0},
-                {"id": "FD-CQ-004", "type": FireDetectorType.SMOKE, "status": "active", "threshold": 3.0}
+                FireDetector(id="FD-CQ-001", type=FireDetectorType.SMOKE, status="active", threshold=3.0),
+                FireDetector(id="FD-CQ-002", type=FireDetectorType.SMOKE, status="active", threshold=3.0),
+                FireDetector(id="FD-CQ-003", type=FireDetectorType.HEAT, status="active", threshold=65.0),
+                FireDetector(id="FD-CQ-004", type=FireDetectorType.SMOKE, status="active", threshold=3.0)
             ],
             "cargo_hold": [
-                {"id": "FD-CH-001", "type": FireDetectorType.SMOKE, "status": "active", "threshold": 4.0},
-                {"id": "FD-CH-002", "type": FireDetectorType.HEAT, "status": "active", "threshold": 70.0},
-                {"id": "FD-CH-003", "type": FireDetectorType.GAS, "status": "active", "threshold": 30.0},
-                {"id": "FD-CH-004", "type": FireDetectorType.SMOKE, "status": "active", "threshold": 4.0}
+                FireDetector(id="FD-CH-001", type=FireDetectorType.SMOKE, status="active", threshold=4.0),
+                FireDetector(id="FD-CH-002", type=FireDetectorType.HEAT, status="active", threshold=70.0),
+                FireDetector(id="FD-CH-003", type=FireDetectorType.GAS, status="active", threshold=30.0),
+                FireDetector(id="FD-CH-004", type=FireDetectorType.SMOKE, status="active", threshold=4.0)
             ],
             "galley": [
-                {"id": "FD-GL-001", "type": FireDetectorType.HEAT, "status": "active", "threshold": 85.0},
-                {"id": "FD-GL-002", "type": FireDetectorType.SMOKE, "status": "active", "threshold": 6.0},
-                {"id": "FD-GL-003", "type": FireDetectorType.GAS, "status": "active", "threshold": 25.0}
+                FireDetector(id="FD-GL-001", type=FireDetectorType.HEAT, status="active", threshold=85.0),
+                FireDetector(id="FD-GL-002", type=FireDetectorType.SMOKE, status="active", threshold=6.0),
+                FireDetector(id="FD-GL-003", type=FireDetectorType.GAS, status="active", threshold=25.0)
             ]
         }
     
-    def _initialize_suppression(self) -> Dict[str, Dict]:
+    def _initialize_suppression(self) -> Dict[str, SuppressionSystem]:
         """Initialize fire suppression systems."""
         return {
-            "engine_room": {
-                "type": "CO2",
-                "status": "ready",
-                "pressure": 150.0,  # bar
-                "capacity": 1000.0,  # kg
-                "discharge_time": 60,  # seconds
-                "last_test": None
-            },
-            "bridge": {
-                "type": "Water Mist",
-                "status": "ready",
-                "pressure": 8.0,
-                "capacity": 500.0,  # liters
-                "discharge_time": 300,
-                "last_test": None
-            },
-            "crew_quarters": {
-                "type": "Sprinkler",
-                "status": "ready",
-                "pressure": 6.0,
-                "capacity": 2000.0,
-                "discharge_time": 600,
-                "last_test": None
-            },
-            "cargo_hold": {
-                "type": "Foam",
-                "status": "ready",
-                "pressure": 10.0,
-                "capacity": 3000.0,
-                "discharge_time": 180,
-                "last_test": None
-            },
-            "galley": {
-                "type": "Wet Chemical",
-                "status": "ready",
-                "pressure": 12.0,
-                "capacity": 200.0,
-                "discharge_time": 30,
-                "last_test": None
-            }
+            "engine_room": SuppressionSystem(
+                type="CO2",
+                status="ready",
+                pressure=150.0,  # bar
+                capacity=1000.0,  # kg
+                discharge_time=60,  # seconds
+                last_test=None
+            ),
+            "bridge": SuppressionSystem(
+                type="Water Mist",
+                status="ready",
+                pressure=8.0,
+                capacity=500.0,  # liters
+                discharge_time=300,
+                last_test=None
+            ),
+            "crew_quarters": SuppressionSystem(
+                type="Sprinkler",
+                status="ready",
+                pressure=6.0,
+                capacity=2000.0,
+                discharge_time=600,
+                last_test=None
+            ),
+            "cargo_hold": SuppressionSystem(
+                type="Foam",
+                status="ready",
+                pressure=10.0,
+                capacity=3000.0,
+                discharge_time=180,
+                last_test=None
+            ),
+            "galley": SuppressionSystem(
+                type="Wet Chemical",
+                status="ready",
+                pressure=12.0,
+                capacity=200.0,
+                discharge_time=30,
+                last_test=None
+            )
         }
     
+    def _build_detector_table(self):
+        """Build struct-of-arrays detector columns for per-zone threshold checks."""
+        thresholds, statuses, sensors = [], [], []
+        self._det_slices = {}
+        for zone, detectors in self.detectors.items():
+            start = len(thresholds)
+            for detector in detectors:
+                thresholds.append(detector.threshold)
+                statuses.append(_DETECTOR_ACTIVE if detector.status == "active" else _DETECTOR_FAULT)
+                sensors.append(_DETECTOR_SENSOR.get(detector.type, -1))
+            self._det_slices[zone] = slice(start, len(thresholds))
+        
+        self._det_thresh = np.asarray(thresholds, dtype=np.float32)
+        self._det_status = np.asarray(statuses, dtype=np.uint8)
+        self._det_sensor = np.asarray(sensors, dtype=np.int8)
+    
+    def _set_detector_status(self, zone: str, index: int, new_status: str):
+        """Change a detector's status, keeping the health counters current."""
+        detector = self.detectors[zone][index]
+        was_active = detector.status == "active"
+        is_active = new_status == "active"
+        detector.status = new_status
+        self._status_cache = None
+        self._det_status[self._det_slices[zone].start + index] = (
+            _DETECTOR_ACTIVE if is_active else _DETECTOR_FAULT
+        )
+        
+        if was_active != is_active:
+            change = 1 if is_active else -1
+            self._active_counts[zone] += change
+            self._faulty_count -= change
+    
     async def register_integration_callback(self, callback):
         """Register callback for system integration."""
-        self.integration_callbacks.append(callback)
+        self.integration_callbacks.add(callback)
         logger.debug(f"Integration callback registered: {callback.__name__}")
     
+    async def register_telemetry_callback(self, callback):
+        """Register callback for batched sensor telemetry ("sensor_batch" events)."""
+        self.telemetry_callbacks.add(callback)
+    
     async def trigger_fire_alarm(self, zone: str, detector_id: str = None, 
                                 cause: str = "Manual activation") -> Dict:
         """
@@ -220,34 +421,40 @@ class FireDetectionSystem:
         Returns:
             Dict with alarm activation result and response actions
         """
+        # A zone already in alarm keeps its existing alarm and response
+        existing_id = self._zone_to_alarm.get(zone)
+        if existing_id is not None:
+            logger.debug(f"Fire alarm already active in {zone} ({existing_id}) - trigger ignored")
+            return {"success": True, "alarm_id": existing_id, "deduped": True}
+        
         logger.critical(f"🔥 FIRE ALARM TRIGGERED - Zone: {zone}, Cause: {cause}")
         
         if zone not in self.zones:
             logger.error(f"Unknown fire zone: {zone}")
             return {"success": False, "error": f"Unknown zone: {zone}"}
         
+        now = datetime.utcnow()
+        now_iso = now.isoformat()
+        
         # Update zone status
         zone_data = self.zones[zone]
-        zone_data["alarm_level"] = AlarmLevel.FIRE_ALARM
-        zone_data["last_alarm"] = datetime.utcnow()
+        zone_data.alarm_level = _FIRE_ALARM
+        zone_data.last_alarm = now
+        self._zone_normal[self._zone_index[zone]] = False
         
         # Add to active alarms
-        alarm_id = f"FA-{zone.upper()}-{int(datetime.utcnow().timestamp())}"
-        self.active_alarms[alarm_id] = {
-            "zone": zone,
-            "detector_id": detector_id,
-            "cause": cause,
-            "start_time": datetime.utcnow(),
-            "level": AlarmLevel.FIRE_ALARM,
-            "suppression_activated": False,
-            "evacuation_ordered": False
-        }
+        alarm_id = f"FA-{self._zone_upper[zone]}-{int(now.timestamp())}"
+        self.active_alarms[alarm_id] = self._acquire_alarm(
+            zone, detector_id, cause, now, time.monotonic_ns()
+        )
+        self._zone_to_alarm[zone] = alarm_id
         
         # Update system status
         self.status = SystemStatus.ALARM
         
         # Coordinate emergency response
         response_actions = await self._coordinate_emergency_response(zone, alarm_id)
+        self._status_cache = None
         
         # Create alarm event record
         event_data = {
@@ -255,9 +462,9 @@ class FireDetectionSystem:
             "zone": zone,
             "detector_id": detector_id,
             "cause": cause,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso,
             "response_actions": response_actions,
-            "priority": zone_data["priority"]
+            "priority": zone_data.priority
         }
         
         # Notify integrated systems
@@ -266,10 +473,10 @@ class FireDetectionSystem:
         # Log critical event
         await self._log_event(
             event_type="FIRE_ALARM_ACTIVATED",
-            severity=EventSeverity.CRITICAL,
+            severity=_SEV_CRIT,
             message=f"Fire alarm activated in {zone}. Cause: {cause}",
             location=zone,
-            additional_data=json.dumps(event_data)
+            additional_data=event_data
         )
         
         return {
@@ -278,31 +485,80 @@ class FireDetectionSystem:
             "zone": zone,
             "cause": cause,
             "response_actions": response_actions,
-            "timestamp": datetime.utcnow().isoformat(),
-            "evacuation_time": zone_data["evacuation_time"]
+            "timestamp": now_iso,
+            "evacuation_time": zone_data.evacuation_time
         }
     
+    def _acquire_alarm(self, zone: str, detector_id: Optional[str], cause: str,
+                       start_time: datetime, start_ns: int) -> Alarm:
+        """Take an alarm record from the pool, allocating one if it is empty."""
+        if not self._alarm_pool:
+            return Alarm(zone, detector_id, cause, start_time, start_ns, _FIRE_ALARM)
+        
+        alarm = self._alarm_pool.pop()
+        alarm.zone = zone
+        alarm.detector_id = detector_id
+        alarm.cause = cause
+        alarm.start_time = start_time
+        alarm.start_ns = start_ns
+        alarm.level = _FIRE_ALARM
+        alarm.suppression_activated = False
+        alarm.evacuation_ordered = False
+        return alarm
+    
+    def _release_alarm(self, alarm: Alarm):
+        """Return a reset alarm record to the pool for reuse."""
+        if len(self._alarm_pool) < _ALARM_POOL_SIZE:
+            self._alarm_pool.append(alarm)
+    
     async def _coordinate_emergency_response(self, zone: str, alarm_id: str) -> List[str]:
         """Coordinate automatic emergency response actions."""
-        actions = []
         zone_data = self.zones[zone]
         alarm_data = self.active_alarms[alarm_id]
         
+        # Suppression system activation (auto-delay for personnel evacuation)
+        suppression_delay = 60 if zone_data.personnel_count > 0 else 10
+        if zone_data.personnel_count > 0:
+            alarm_data.evacuation_ordered = True
+        
+        values = {
+            "personnel_count": zone_data.personnel_count,
+            "evacuation_time": zone_data.evacuation_time,
+            "suppression_delay": suppression_delay
+        }
+        actions = [action.format_map(values) for action in self._response_templates[zone]]
+        
+        # Schedule suppression system activation
+        self._schedule_timer(suppression_delay, partial(self._delayed_suppression_activation, zone, alarm_id))
+        self._journal(
+            "trigger", alarm_id,
+            zone=zone,
+            detector_id=alarm_data.detector_id,
+            cause=alarm_data.cause,
+            start_time=alarm_data.start_time.isoformat(),
+            evacuation_ordered=alarm_data.evacuation_ordered,
+            suppression_delay=suppression_delay
+        )
+        
+        return actions
+    
+    def _build_response_template(self, zone: str, zone_data: FireZone) -> Tuple[str, ...]:
+        """Build the ordered emergency response actions for a zone."""
+        actions = []
+        
         # 1. Immediate actions based on zone priority
-        if zone_data["priority"] == "critical":
+        if zone_data.priority == "critical":
             actions.append("Emergency stop initiated for affected areas")
             actions.append("Bridge notified immediately")
             actions.append("Emergency lighting activated")
         
         # 2. Evacuation procedures
-        if zone_data["personnel_count"] > 0:
-            actions.append(f"Evacuation order for {zone_data['personnel_count']} personnel")
-            actions.append(f"Evacuation time: {zone_data['evacuation_time']} seconds")
-            alarm_data["evacuation_ordered"] = True
+        if zone_data.personnel_count > 0:
+            actions.append("Evacuation order for {personnel_count} personnel")
+            actions.append("Evacuation time: {evacuation_time} seconds")
         
-        # 3. Suppression system activation (auto-delay for personnel evacuation)
-        suppression_delay = 60 if zone_data["personnel_count"] > 0 else 10
-        actions.append(f"Fire suppression activation scheduled in {suppression_delay} seconds")
+        # 3. Suppression system activation
+        actions.append("Fire suppression activation scheduled in {suppression_delay} seconds")
         
         # 4. CCTV and monitoring
         actions.append(f"CCTV cameras focused on {zone}")
@@ -321,16 +577,13 @@ class FireDetectionSystem:
             actions.append("Gas supply isolation")
             actions.append("Electrical isolation for cooking equipment")
         
-        # Schedule suppression system activation
-        asyncio.create_task(self._delayed_suppression_activation(zone, alarm_id, suppression_delay))
-        
-        return actions
+        return tuple(actions)
     
-    async def _delayed_suppression_activation(self, zone: str, alarm_id: str, delay: int):
-        """Activate suppression system after evacuation delay."""
-        await asyncio.sleep(delay)
-        
-        if alarm_id in self.active_alarms and not self.active_alarms[alarm_id]["suppression_activated"]:
+    async def _delayed_suppression_activation(self, zone: str, alarm_id: str):
+        """Activate suppression system once the evacuation delay has expired."""
+        # Alarms reset during the delay leave this timer as a tombstone
+        alarm = self.active_alarms.get(alarm_id)
+        if alarm is not None and not alarm.suppression_activated:
             await self.activate_suppression_system(zone, alarm_id)
     
     async def activate_suppression_system(self, zone: str, alarm_id: str) -> Dict:
@@ -343,49 +596,51 @@ class FireDetectionSystem:
         suppression = self.suppression_systems[zone]
         
         # Update suppression status
-        suppression["status"] = "discharging"
+        suppression.status = "discharging"
+        self._status_cache = None
         
         # Update alarm record
-        if alarm_id in self.active_alarms:
-            self.active_alarms[alarm_id]["suppression_activated"] = True
+        alarm = self.active_alarms.get(alarm_id)
+        if alarm is not None:
+            alarm.suppression_activated = True
+            self._journal("suppress", alarm_id)
         
         # Log suppression activation
         await self._log_event(
             event_type="SUPPRESSION_ACTIVATED",
-            severity=EventSeverity.CRITICAL,
+            severity=_SEV_CRIT,
             message=f"Fire suppression system activated in {zone}",
             location=zone,
-            additional_data=json.dumps({
-                "suppression_type": suppression["type"],
-                "discharge_time": suppression["discharge_time"],
+            additional_data={
+                "suppression_type": suppression.type,
+                "discharge_time": suppression.discharge_time,
                 "alarm_id": alarm_id
-            })
+            }
         )
         
         # Simulate suppression discharge time
-        asyncio.create_task(self._complete_suppression_discharge(zone, suppression["discharge_time"]))
+        self._schedule_timer(suppression.discharge_time, partial(self._complete_suppression_discharge, zone))
         
         return {
             "success": True,
             "zone": zone,
-            "suppression_type": suppression["type"],
-            "discharge_time": suppression["discharge_time"],
+            "suppression_type": suppression.type,
+            "discharge_time": suppression.discharge_time,
             "status": "activated"
         }
     
-    async def _complete_suppression_discharge(self, zone: str, discharge_time: int):
+    async def _complete_suppression_discharge(self, zone: str):
         """Complete suppression system discharge cycle."""
-        await asyncio.sleep(discharge_time)
-        
         suppression = self.suppression_systems[zone]
-        suppression["status"] = "discharged"
+        suppression.status = "discharged"
+        self._status_cache = None
         
         logger.info(f"✅ Fire suppression discharge completed in {zone}")
         
         # Log completion
         await self._log_event(
             event_type="SUPPRESSION_COMPLETED",
-            severity=EventSeverity.INFO,
+            severity=_SEV_INFO,
             message=f"Fire suppression discharge completed in {zone}",
             location=zone
         )
@@ -396,27 +651,37 @@ class FireDetectionSystem:
             return {"success": False, "error": f"Unknown alarm ID: {alarm_id}"}
         
         alarm_data = self.active_alarms[alarm_id]
-        zone = alarm_data["zone"]
+        zone = alarm_data.zone
         
         logger.info(f"🔄 Resetting fire alarm {alarm_id} in zone {zone}")
         
         # Reset zone status
         zone_data = self.zones[zone]
-        zone_data["alarm_level"] = AlarmLevel.NORMAL
-        zone_data["temperature"] = 22.0  # Return to normal temperature
-        zone_data["smoke_level"] = 0.0
-        zone_data["gas_level"] = 0.0
+        zone_data.alarm_level = _NORMAL
+        zone_data.temperature = 22.0  # Return to normal temperature
+        zone_data.smoke_level = 0.0
+        zone_data.gas_level = 0.0
+        zone_idx = self._zone_index[zone]
+        self._readings[zone_idx] = self._published[zone_idx] = (22.0, 0.0, 0.0)
+        self._zone_normal[zone_idx] = True
         
         # Reset suppression system
         if zone in self.suppression_systems:
             suppression = self.suppression_systems[zone]
-            if suppression["status"] in ["discharging", "discharged"]:
-                suppression["status"] = "recharging"
-                # Simulate recharge time
-                asyncio.create_task(self._recharge_suppression_system(zone))
+            if suppression.status in ["discharging", "discharged"]:
+                suppression.status = "recharging"
+                # Simulate recharge time - 5 minutes
+                self._schedule_timer(300, partial(self._recharge_suppression_system, zone))
+        
+        duration_ns = time.monotonic_ns() - alarm_data.start_ns
+        alarm_duration = f"{duration_ns / 1e9:.3f}s"
+        now = datetime.utcnow()
         
         # Remove from active alarms
-        del self.active_alarms[alarm_id]
+        self._release_alarm(self.active_alarms.pop(alarm_id))
+        del self._zone_to_alarm[zone]
+        self._journal("reset", alarm_id)
+        self._status_cache = None
         
         # Update system status if no more active alarms
         if not self.active_alarms:
@@ -426,51 +691,184 @@ class FireDetectionSystem:
         # Log reset event
         await self._log_event(
             event_type="FIRE_ALARM_RESET",
-            severity=EventSeverity.INFO,
+            severity=_SEV_INFO,
             message=f"Fire alarm reset in {zone}",
             location=zone,
-            additional_data=json.dumps({
+            additional_data={
                 "alarm_id": alarm_id,
-                "duration": str(datetime.utcnow() - alarm_data["start_time"])
-            })
+                "duration": alarm_duration
+            }
         )
         
         return {
             "success": True,
             "alarm_id": alarm_id,
             "zone": zone,
-            "reset_time": datetime.utcnow().isoformat(),
-            "alarm_duration": str(datetime.utcnow() - alarm_data["start_time"])
+            "reset_time": now.isoformat(),
+            "alarm_duration": alarm_duration
         }
     
     async def _recharge_suppression_system(self, zone: str):
         """Recharge suppression system after use."""
-        await asyncio.sleep(300)  # 5 minutes recharge time
-        
         suppression = self.suppression_systems[zone]
-        suppression["status"] = "ready"
+        suppression.status = "ready"
+        self._status_cache = None
         
         logger.info(f"🔋 Fire suppression system recharged in {zone}")
     
+    def _schedule_timer(self, delay: float, callback: Callable[[], Awaitable]):
+        """Schedule a coroutine callback to run after delay seconds."""
+        self._timers.schedule(delay, callback)
+    
+    def _journal(self, event: str, alarm_id: str, **fields):
+        """Queue an alarm transition for the journal writer."""
+        if self._journal_path is None:
+            return
+        
+        if self._journal_task is None:
+            self._journal_task = asyncio.create_task(self._journal_writer())
+        
+        self._journal_seq += 1
+        self._journal_q.put_nowait({"seq": self._journal_seq, "event": event, "alarm_id": alarm_id, **fields})
+    
+    async def _journal_writer(self):
+        """Append queued journal entries, batching each flush interval into one fsync."""
+        while True:
+            entries = [await self._journal_q.get()]
+            await asyncio.sleep(_JOURNAL_FLUSH_INTERVAL)
+            while not self._journal_q.empty():
+                entries.append(self._journal_q.get_nowait())
+            
+            try:
+                await asyncio.to_thread(self._write_journal, entries, "a")
+            except Exception as e:
+                logger.error(f"Error writing fire alarm journal: {e}")
+            finally:
+                for _ in entries:
+                    self._journal_q.task_done()
+    
+    def _write_journal(self, entries: List[Dict], mode: str):
+        """Write journal entries as JSON lines and fsync the file."""
+        with self._journal_path.open(mode, encoding="utf-8") as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in entries)
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def _replay_journal(self):
+        """Restore active alarms from the journal and compact it to the live entries."""
+        self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self._journal_path.exists():
+            return
+        
+        live: Dict[str, List[Dict]] = {}
+        with self._journal_path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write can leave a torn final line
+                    logger.warning("Skipping unreadable fire alarm journal entry: {!r}", line)
+                    continue
+                
+                self._journal_seq = max(self._journal_seq, entry["seq"])
+                alarm_id = entry["alarm_id"]
+                if entry["event"] == "trigger":
+                    live[alarm_id] = [entry]
+                elif entry["event"] == "reset":
+                    live.pop(alarm_id, None)
+                elif alarm_id in live:
+                    live[alarm_id].append(entry)
+        
+        now = datetime.utcnow()
+        now_ns = time.monotonic_ns()
+        restored: List[Dict] = []
+        for alarm_id, entries in live.items():
+            trigger = entries[0]
+            zone = trigger["zone"]
+            if zone not in self.zones or zone in self._zone_to_alarm:
+                logger.warning("Discarding journaled fire alarm {} for zone {}", alarm_id, zone)
+                continue
+            restored.extend(entries)
+            
+            start_time = datetime.fromisoformat(trigger["start_time"])
+            elapsed = (now - start_time).total_seconds()
+            alarm = self._acquire_alarm(
+                zone, trigger["detector_id"], trigger["cause"], start_time, now_ns - int(elapsed * 1e9)
+            )
+            alarm.evacuation_ordered = trigger["evacuation_ordered"]
+            alarm.suppression_activated = len(entries) > 1
+            self.active_alarms[alarm_id] = alarm
+            self._zone_to_alarm[zone] = alarm_id
+            
+            zone_data = self.zones[zone]
+            zone_data.alarm_level = _FIRE_ALARM
+            zone_data.last_alarm = start_time
+            self._zone_normal[self._zone_index[zone]] = False
+            
+            if alarm.suppression_activated:
+                self.suppression_systems[zone].status = "discharged"
+            else:
+                self._pending_suppression[alarm_id] = max(0.0, trigger["suppression_delay"] - elapsed)
+        
+        if self.active_alarms:
+            self.status = SystemStatus.ALARM
+            logger.warning("🔥 Restored {} active fire alarms from journal", len(self.active_alarms))
+        
+        # Only restored alarms are kept; skipped entries would otherwise survive every restart
+        self._write_journal(restored, "w")
+    
+    async def resume_suppression_timers(self):
+        """Schedule suppression still pending for alarms restored from the journal."""
+        for alarm_id, delay in self._pending_suppression.items():
+            alarm = self.active_alarms.get(alarm_id)
+            if alarm is not None:
+                self._schedule_timer(delay, partial(self._delayed_suppression_activation, alarm.zone, alarm_id))
+        self._pending_suppression.clear()
+    
+    async def aclose(self):
+        """Stop scheduled timers, flush pending journal entries and stop the journal writer."""
+        # Stop timers first so no suppression fires after the journal is closed
+        await self._timers.aclose()
+        
+        if self._journal_task is None:
+            return
+        
+        await self._journal_q.join()
+        self._journal_task.cancel()
+        try:
+            await self._journal_task
+        except asyncio.CancelledError:
+            pass
+        self._journal_task = None
+    
     async def get_system_status(self) -> Dict:
         """Get current fire detection system status."""
-        return {
-            "system_type": self.system_type.value,
-            "status": self.status.value,
-            "zones": self.zones,
-            "active_alarms": len(self.active_alarms),
-            "alarm_details": self.active_alarms,
-            "detectors": self._get_detector_summary(),
-            "suppression_systems": self.suppression_systems,
-            "last_test": self.last_test.isoformat() if self.last_test else None,
-            "performance_score": self._calculate_performance_score()
-        }
+        if self._status_cache is None:
+            # Nested sections are read-only views, since every caller shares them
+            # with the cached snapshot until the next state change
+            self._status_cache = {
+                "system_type": self.system_type.value,
+                "status": self.status.value,
+                "zones": _frozen_view({zone: asdict(zone_data) for zone, zone_data in self.zones.items()}),
+                "active_alarms": len(self.active_alarms),
+                "alarm_details": _frozen_view(
+                    {alarm_id: asdict(alarm) for alarm_id, alarm in self.active_alarms.items()}
+                ),
+                "detectors": _frozen_view(self._get_detector_summary()),
+                "suppression_systems": _frozen_view({
+                    zone: asdict(suppression) for zone, suppression in self.suppression_systems.items()
+                }),
+                "last_test": self.last_test.isoformat() if self.last_test else None
+            }
+        
+        # The score ages with the last test, so it is never cached
+        return {**self._status_cache, "performance_score": self._calculate_performance_score()}
     
     def _get_detector_summary(self) -> Dict:
         """Get summary of all detectors."""
         summary = {}
         for zone, detectors in self.detectors.items():
-            active_count = sum(1 for d in detectors if d["status"] == "active")
+            active_count = self._active_counts[zone]
             summary[zone] = {
                 "total": len(detectors),
                 "active": active_count,
@@ -483,38 +881,47 @@ class FireDetectionSystem:
         logger.info("🧪 Performing fire detection system test")
         
         self.last_test = datetime.utcnow()
+        self._status_cache = None
         test_results = {}
         
+        # Simulate detector tests for every detector at once
+        detector_count = len(self._det_thresh)
+        response_times = self._rng.uniform(0.1, 0.5, detector_count)
+        sensitivities = self._rng.uniform(0.9, 1.0, detector_count)
+        passed = (response_times < 1.0) & (sensitivities > 0.85)
+        
+        # Convert once so the per-detector results are built from plain Python values
+        passed_list = passed.tolist()
+        response_list = response_times.tolist()
+        sensitivity_list = sensitivities.tolist()
+        
         # Test each zone's detectors
         for zone, detectors in self.detectors.items():
-            zone_results = []
-            for detector in detectors:
-                # Simulate detector test
-                response_time = random.uniform(0.1, 0.5)
-                sensitivity = random.uniform(0.9, 1.0)
-                test_passed = response_time < 1.0 and sensitivity > 0.85
-                
-                zone_results.append({
-                    "detector_id": detector["id"],
-                    "type": detector["type"],
-                    "passed": test_passed,
-                    "response_time": response_time,
-                    "sensitivity": sensitivity
-                })
+            zone_slice = self._det_slices[zone]
+            zone_results = [
+                {
+                    "detector_id": detector.id,
+                    "type": detector.type,
+                    "passed": passed_list[i],
+                    "response_time": response_list[i],
+                    "sensitivity": sensitivity_list[i]
+                }
+                for i, detector in enumerate(detectors, zone_slice.start)
+            ]
             
             test_results[zone] = {
                 "detectors": zone_results,
-                "zone_status": "PASS" if all(r["passed"] for r in zone_results) else "FAIL"
+                "zone_status": "PASS" if passed[zone_slice].all() else "FAIL"
             }
         
         # Test suppression systems
         suppression_results = {}
         for zone, suppression in self.suppression_systems.items():
-            pressure_ok = suppression["pressure"] > 5.0
-            capacity_ok = suppression["capacity"] > 100.0
+            pressure_ok = suppression.pressure > 5.0
+            capacity_ok = suppression.capacity > 100.0
             
             suppression_results[zone] = {
-                "type": suppression["type"],
+                "type": suppression.type,
                 "pressure_test": "PASS" if pressure_ok else "FAIL",
                 "capacity_test": "PASS" if capacity_ok else "FAIL",
                 "overall": "PASS" if pressure_ok and capacity_ok else "FAIL"
@@ -523,12 +930,12 @@ class FireDetectionSystem:
         # Log test event
         await self._log_event(
             event_type="SYSTEM_TEST_COMPLETED",
-            severity=EventSeverity.INFO,
+            severity=_SEV_INFO,
             message="Fire detection system test completed",
-            additional_data=json.dumps({
+            additional_data={
                 "detector_results": test_results,
                 "suppression_results": suppression_results
-            })
+            }
         )
         
         return {
@@ -547,9 +954,7 @@ class FireDetectionSystem:
         base_score -= len(self.active_alarms) * 15
         
         # Reduce score for faulty detectors
-        for zone, detectors in self.detectors.items():
-            faulty_count = sum(1 for d in detectors if d["status"] != "active")
-            base_score -= faulty_count * 5
+        base_score -= self._faulty_count * 5
         
         # Reduce score if last test was too long ago
         if self.last_test:
@@ -561,38 +966,112 @@ class FireDetectionSystem:
         
         return max(0, base_score)
     
-    async def _notify_integrated_systems(self, event_type: str, data: Dict):
-        """Notify other systems of fire detection events."""
-        for callback in self.integration_callbacks:
-            try:
-                await callback(self.system_type, event_type, data)
-            except Exception as e:
-                logger.error(f"Error notifying integrated system: {e}")
+    async def _notify_integrated_systems(self, event_type: str, data: Dict, callbacks=None):
+        """Notify other systems of fire detection events (integration callbacks by default)."""
+        # Integrations run concurrently so one slow subscriber does not
+        # delay the others, bounded so a large fan-out cannot swamp the loop
+        async def notify(callback):
+            async with self._notify_sem:
+                return await callback(self.system_type, event_type, data)
+        
+        results = await asyncio.gather(
+            *(notify(callback) for callback in (self.integration_callbacks if callbacks is None else callbacks)),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error notifying integrated system: {result}")
     
     async def _log_event(self, event_type: str, severity: EventSeverity, 
-                        message: str, location: str = None, additional_data: str = None):
+                        message: str, location: str = None, additional_data: Optional[Dict] = None):
         """Log system event to database."""
-        # This would be implemented with actual database logging
-        logger.info(f"Event logged: {event_type} - {message}")
+        # This would be implemented with actual database logging. Event data
+        # is bound as a structured field so it is only serialized by sinks
+        # that actually emit it.
+        logger.bind(
+            event_type=event_type, severity=severity.value, location=location, data=additional_data
+        ).info("Event logged: {} - {}", event_type, message)
     
     async def start_monitoring(self):
-        """Start continuous monitoring of fire detection sensors."""
+        """Start event-driven monitoring of fire detection sensors."""
         logger.info("🔍 Starting fire detection monitoring")
+        await self.resume_suppression_timers()
+        simulator = asyncio.create_task(self._simulate_sensors())
+        notifier = asyncio.create_task(self._flush_sensor_notifications())
+        try:
+            while True:
+                event = await self._event_q.get()
+                await self._apply_sensor_event(event)
+        finally:
+            simulator.cancel()
+            notifier.cancel()
+    
+    def publish_sensor_reading(self, zone: str, sensor: str, value: float):
+        """Publish a sensor reading for the monitoring loop to apply."""
+        self._event_q.put_nowait({"zone": zone, "sensor": sensor, "value": value})
+    
+    async def _apply_sensor_event(self, event: Dict):
+        """Apply a sensor reading and raise an alarm if a detector threshold is exceeded."""
+        zone = event["zone"]
+        sensor = event["sensor"]
+        value = event["value"]
+        
+        zone_data = self.zones.get(zone)
+        if zone_data is None or sensor not in _SENSOR_INDEX:
+            logger.error(f"Unknown sensor reading: {zone}/{sensor}")
+            return
+        
+        setattr(zone_data, sensor, value)
+        self._status_cache = None
+        if self.telemetry_callbacks:
+            self._pending_notify[zone, sensor] = event
+        
+        # Only real sensor input trips detectors; the simulator's random walk
+        # would otherwise eventually raise spurious alarms
+        if zone_data.alarm_level != _NORMAL or event.get("simulated"):
+            return
+        
+        zone_slice = self._det_slices[zone]
+        exceeded = np.flatnonzero(
+            (self._det_sensor[zone_slice] == _SENSOR_INDEX[sensor])
+            & (self._det_status[zone_slice] == _DETECTOR_ACTIVE)
+            & (self._det_thresh[zone_slice] < value)
+        )
+        if exceeded.size:
+            detector = self.detectors[zone][exceeded[0]]
+            await self.trigger_fire_alarm(
+                zone, detector.id,
+                cause=f"{detector.type.value} detector threshold exceeded ({value:.2f})"
+            )
+    
+    async def _flush_sensor_notifications(self):
+        """Send applied sensor readings to telemetry subscribers as one batch per interval."""
+        while True:
+            await asyncio.sleep(_SENSOR_NOTIFY_INTERVAL)
+            if self._pending_notify:
+                batch = list(self._pending_notify.values())
+                self._pending_notify = {}
+                await self._notify_integrated_systems(
+                    "sensor_batch", {"updates": batch}, self.telemetry_callbacks
+                )
+    
+    async def _simulate_sensors(self):
+        """Simulate sensor drivers, publishing only significant changes."""
         while True:
             await self._update_sensor_readings()
             await asyncio.sleep(5)  # Update every 5 seconds
     
     async def _update_sensor_readings(self):
-        """Update sensor readings with simulated values."""
-        for zone_name, zone_data in self.zones.items():
-            # Simulate environmental changes
-            if zone_data["alarm_level"] == AlarmLevel.NORMAL:
-                # Normal variations
-                zone_data["temperature"] += random.uniform(-0.5, 0.5)
-                zone_data["smoke_level"] = max(0, zone_data["smoke_level"] + random.uniform(-0.05, 0.05))
-                zone_data["gas_level"] = max(0, zone_data["gas_level"] + random.uniform(-0.01, 0.01))
-            
-            # Keep values within realistic ranges
-            zone_data["temperature"] = max(10, min(60, zone_data["temperature"]))
-            zone_data["smoke_level"] = max(0, min(10, zone_data["smoke_level"]))
-            zone_data["gas_level"] = max(0, min(100, zone_data["gas_level"])) 
\ No newline at end of file
+        """Update simulated sensor values and publish readings that changed."""
+        # Normal environmental variations, clamped to realistic ranges
+        steps = self._rng.uniform(-1.0, 1.0, self._readings.shape).astype(np.float32)
+        steps *= _SENSOR_STEPS
+        publish = _sensor_tick(self._readings, steps, self._zone_normal, self._published)
+        
+        for zone_idx, sensor_idx in zip(*np.nonzero(publish)):
+            value = float(self._readings[zone_idx, sensor_idx])
+            self._published[zone_idx, sensor_idx] = value
+            self._event_q.put_nowait({
+                "zone": self._zone_names[zone_idx], "sensor": _SENSORS[sensor_idx],
+                "value": value, "simulated": True
+            })
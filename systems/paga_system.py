@@ -10,13 +10,24 @@ This system demonstrates understanding of:
 """
 
 import asyncio
+import copy
+import heapq
+import itertools
 import json
+import re
+import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional
-from enum import Enum
+from functools import partial
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Set, Tuple
+from dataclasses import asdict, dataclass, replace
+from enum import Enum, IntEnum
 
+import numpy as np
 from loguru import logger
 from database.models import SystemType, SystemStatus, EventSeverity
+from utils.deadline_scheduler import DeadlineScheduler
 
 class AlarmType(str, Enum):
     GENERAL_ALARM = "general_alarm"
@@ -32,6 +43,194 @@ class AnnouncementPriority(str, Enum):
     HIGH = "high"
     EMERGENCY = "emergency"
 
+class Zone(IntEnum):
+    BRIDGE = 0
+    ENGINE_ROOM = 1
+    CREW_QUARTERS = 2
+    CARGO_HOLD = 3
+    GALLEY = 4
+    DECK_AREAS = 5
+    ALL_ZONES = 6
+
+# Zone names as used in the API and zone configuration, and the zones that
+# have their own speakers, in Zone index order
+_ZONE_NAME_TO_IDX: Dict[str, Zone] = {zone.name.lower(): zone for zone in Zone}
+_SPEAKER_ZONES: Tuple[str, ...] = tuple(zone.name.lower() for zone in Zone if zone is not Zone.ALL_ZONES)
+
+@dataclass(slots=True)
+class Speaker:
+    zone: str
+    location: str
+    status: str
+    volume: int
+    frequency_response: str
+    last_test: Optional[datetime]
+    fault_detected: bool
+
+@dataclass(slots=True)
+class Announcement:
+    type: str  # "alarm", "announcement" or "custom_announcement"
+    zones: List[str]
+    start_time: datetime
+    duration: int  # seconds
+    status: str = ""
+    alarm_type: Optional[AlarmType] = None
+    custom_message: Optional[str] = None
+    template: Optional[str] = None
+    message: Optional[str] = None
+    priority: Optional[AnnouncementPriority] = None
+
+class PAGAEvent(NamedTuple):
+    """One notification, shared read-only by every integration callback."""
+    system_type: SystemType
+    event_type: str
+    data: Mapping
+
+# Playback order for overlapping announcements; alarms rank with emergencies
+_PRIORITY_RANK = {
+    AnnouncementPriority.EMERGENCY: 0,
+    AnnouncementPriority.HIGH: 1,
+    AnnouncementPriority.MEDIUM: 2,
+    AnnouncementPriority.LOW: 3
+}
+
+# Emergency event types and the alarm each one sounds (others sound the general alarm)
+_EVENT_ALARM_MAP: Dict[str, AlarmType] = {
+    "fire_alarm": AlarmType.FIRE_ALARM,
+    "emergency_stop": AlarmType.GENERAL_ALARM,
+    "man_overboard": AlarmType.MAN_OVERBOARD,
+    "abandon_ship": AlarmType.ABANDON_SHIP
+}
+
+# Voice announcement template that follows each alarm, where one exists
+_ALARM_TEMPLATES: Dict[AlarmType, str] = {
+    AlarmType.ABANDON_SHIP: "abandon_ship",
+    AlarmType.MAN_OVERBOARD: "man_overboard",
+    AlarmType.ALL_CLEAR: "all_clear"
+}
+
+_ALARM_TYPES_AVAILABLE: Tuple[str, ...] = tuple(alarm_type.value for alarm_type in AlarmType)
+
+# Simulated alarm sequence test outcome, copied per alarm type
+_ALARM_TEST_RESULT = {
+    "sequence_available": True,
+    "frequency_test": "PASS",
+    "duration_test": "PASS",
+    "override_test": "PASS"
+}
+
+# Default broadcast target and its pre-encoded JSON form
+_ALL_ZONES = ["all_zones"]
+_ALL_ZONES_JSON = json.dumps(_ALL_ZONES)
+
+# PAGA zones for ship areas; each instance works on its own copy
+_DEFAULT_ZONES: Dict[str, Dict] = {
+    "bridge": {
+        "name": "Bridge",
+        "priority": "critical",
+        "speaker_count": 4,
+        "volume_level": 8,
+        "status": "active",
+        "emergency_override": True,
+        "backup_power": True
+    },
+    "engine_room": {
+        "name": "Engine Room",
+        "priority": "critical",
+        "speaker_count": 6,
+        "volume_level": 9,  # Higher due to ambient noise
+        "status": "active",
+        "emergency_override": True,
+        "backup_power": True
+    },
+    "crew_quarters": {
+        "name": "Crew Quarters",
+        "priority": "high",
+        "speaker_count": 12,
+        "volume_level": 7,
+        "status": "active",
+        "emergency_override": True,
+        "backup_power": True
+    },
+    "cargo_hold": {
+        "name": "Cargo Hold",
+        "priority": "medium",
+        "speaker_count": 8,
+        "volume_level": 8,
+        "status": "active",
+        "emergency_override": True,
+        "backup_power": False
+    },
+    "galley": {
+        "name": "Galley",
+        "priority": "medium",
+        "speaker_count": 3,
+        "volume_level": 6,
+        "status": "active",
+        "emergency_override": True,
+        "backup_power": False
+    },
+    "deck_areas": {
+        "name": "Deck Areas",
+        "priority": "high",
+        "speaker_count": 10,
+        "volume_level": 9,  # Outdoor speakers need higher volume
+        "status": "active",
+        "emergency_override": True,
+        "backup_power": True
+    },
+    "all_zones": {
+        "name": "All Zones",
+        "priority": "emergency",
+        "speaker_count": 43,  # Total of all speakers
+        "volume_level": 8,
+        "status": "active",
+        "emergency_override": True,
+        "backup_power": True
+    }
+}
+
+def _build_speakers(zones: Dict[str, Dict]) -> Tuple[Dict[str, Speaker], Dict[str, Tuple[str, ...]]]:
+    """Build the speaker configuration and the speaker keys of each zone."""
+    speakers = {}
+    speakers_by_zone = {}
+    speaker_id = 1
+    
+    for zone_name, zone_data in zones.items():
+        if zone_name == "all_zones":
+            continue
+        
+        zone_speakers = []
+        for i in range(zone_data["speaker_count"]):
+            speaker_key = f"SPK{speaker_id:03d}"
+            zone_speakers.append(speaker_key)
+            speakers[speaker_key] = Speaker(
+                zone=zone_name,
+                location=f"{zone_data['name']} - Speaker {i+1}",
+                status="online",
+                volume=zone_data["volume_level"],
+                frequency_response="excellent",
+                last_test=None,
+                fault_detected=False
+            )
+            speaker_id += 1
+        speakers_by_zone[zone_name] = tuple(zone_speakers)
+    
+    return speakers, speakers_by_zone
+
+assert tuple(_DEFAULT_ZONES) == tuple(_ZONE_NAME_TO_IDX), "zone configuration out of Zone order"
+
+# Speaker configuration is static, so it is built once and copied per instance
+_DEFAULT_SPEAKERS, _DEFAULT_SPEAKERS_BY_ZONE = _build_speakers(_DEFAULT_ZONES)
+
+_SPEAKER_OFFLINE = 0
+_SPEAKER_ONLINE = 1
+
+# Completed alarms and announcements kept for status reporting, and the
+# upper bound on evicted records kept for reuse
+_ANNOUNCEMENT_HISTORY = 64
+_ANNOUNCEMENT_POOL_SIZE = 128
+
 class PAGASystem:
     """
     PAGA System for ship communication and emergency alarms.
@@ -40,111 +239,67 @@ class PAGASystem:
     integration with other ship safety systems.
     """
     
-    def __init__(self):
+    def __init__(self, max_concurrent_notifications: int = 8):
         self.system_type = SystemType.PAGA
         self.status = SystemStatus.NORMAL
         self.zones = self._initialize_zones()
+        # Read-only view handed out by get_system_status instead of the live dict
+        self._zones_view = MappingProxyType(self.zones)
         self.speakers = self._initialize_speakers()
-        self.active_announcements = {}
+        # Flat speaker table for vectorized tests, mirroring self.speakers
+        self._build_speaker_table()
+        # Maintained by _set_speaker_status so status calls need no speaker scan
+        self._online_speaker_count = int(np.count_nonzero(self._spk_status == _SPEAKER_ONLINE))
+        self.active_announcements: Dict[str, Announcement] = {}
+        # Announcements currently playing, maintained by _set_announcement_status
+        self._active_announcement_count = 0
+        # Completed record ids, oldest first; records evicted past the history
+        # limit are recycled through the pool
+        self._finished_ids: deque = deque()
+        self._ann_pool: List[Announcement] = []
+        # Ids of alarm sequences still sounding
+        self._active_alarms: Set[str] = set()
+        # Live alarms and announcements ordered by (priority rank, monotonic
+        # start); finished entries are dropped lazily when they reach the top
+        self._priority_heap: List[Tuple[int, float, str]] = []
+        # Alarm and announcement completions share one deadline worker task
+        self._deadlines = DeadlineScheduler("PAGA")
+        # Ids come from per-system counters, so alarms raised in the same
+        # second no longer collide
+        self._alarm_prefix = {alarm_type: f"ALM-{alarm_type.value.upper()}-" for alarm_type in AlarmType}
+        self._alarm_counter = itertools.count(1)
+        self._ann_counter = itertools.count(1)
         self.alarm_sequences = self._initialize_alarm_sequences()
+        # Static part of each alarm's event log payload, left open so the
+        # per-alarm fields can be appended without re-encoding it
+        self._alarm_log_prefix = {
+            alarm_type: json.dumps(
+                {"alarm_type": alarm_type.value, "duration": config["duration"]}, separators=(",", ":")
+            )[:-1]
+            for alarm_type, config in self.alarm_sequences.items()
+        }
         self.message_templates = self._initialize_message_templates()
         self.volume_levels = {}
         self.last_test = None
         self.integration_callbacks = []
+        # Bumped on every state change so pollers can skip unchanged status
+        self._state_version = 0
+        # Last score as (state version, days since test, score)
+        self._score_cache: Optional[Tuple[int, Optional[int], float]] = None
+        # Caps how many integration callbacks run at once per notification
+        self._notify_sem = asyncio.Semaphore(max_concurrent_notifications)
         
         logger.info("📢 PAGA System initialized")
     
     def _initialize_zones(self) -> Dict[str, Dict]:
         """Initialize PAGA zones for ship areas."""
-        return {
-            "bridge": {
-                "name": "Bridge",
-                "priority": "critical",
-                "speaker_count": 4,
-                "volume_level": 8,
-                "status": "active",
-                "emergency_override": True,
-                "backup_power": True
-            },
-            "engine_room": {
-                "name": "Engine Room",
-                "priority": "critical",
-                "speaker_count": 6,
-                "volume_level": 9,  # Higher due to ambient noise
-                "status": "active",
-                "emergency_override": True,
-                "backup_power": True
-            },
-            "crew_quarters": {
-                "name": "Crew Quarters",
-                "priority": "high",
-                "speaker_count": 12,
-                "volume_level": 7,
-                "status": "active",
-                "emergency_override": True,
-                "backup_power": True
-            },
-            "cargo_hold": {
-                "name": "Cargo Hold",
-                "priority": "medium",
-                "speaker_count": 8,
-                "volume_level": 8,
-                "status": "active",
-                "emergency_override": True,
-                "backup_power": False
-            },
-            "galley": {
-                "name": "Galley",
-                "priority": "medium",
-                "speaker_count": 3,
-                "volume_level": 6,
-                "status": "active",
-                "emergency_override": True,
-                "backup_power": False
-            },
-            "deck_areas": {
-                "name": "Deck Areas",
-                "priority": "high",
-                "speaker_count": 10,
-                "volume_level": 9,  # Outdoor speakers need higher volume
-                "status": "active",
-                "emergency_override": True,
-                "backup_power": True
-            },
-            "all_zones": {
-                "name": "All Zones",
-                "priority": "emergency",
-                "speaker_count": 43,  # Total of all speakers
-                "volume_level": 8,
-                "status": "active",
-                "emergency_override": True,
-                "backup_power": True
-            }
-        }
+        return copy.deepcopy(_DEFAULT_ZONES)
     
-    def _initialize_speakers(self) -> Dict[str, Dict]:
+    def _initialize_speakers(self) -> Dict[str, Speaker]:
         """Initialize individual speaker configuration."""
-        speakers = {}
-        speaker_id = 1
-        
-        for zone_name, zone_data in self.zones.items():
-            if zone_name == "all_zones":
-                continue
-                
-            for i in range(zone_data["speaker_count"]):
-                speaker_key = f"SPK{speaker_id:03d}"
-                speakers[speaker_key] = {
-                    "zone": zone_name,
-                    "location": f"{zone_data['name']} - Speaker {i+1}",
-                    "status": "online",
-                    "volume": zone_data["volume_level"],
-                    "frequency_response": "excellent",
-                    "last_test": None,
-                    "fault_detected": False
-                }
-                speaker_id += 1
-        
-        return speakers
+        # Speaker keys per zone, so zone tests do not filter every speaker
+        self._speakers_by_zone = _DEFAULT_SPEAKERS_BY_ZONE
+        return {key: replace(speaker) for key, speaker in _DEFAULT_SPEAKERS.items()}
     
     def _initialize_alarm_sequences(self) -> Dict[str, Dict]:
         """Initialize alarm sequences for different emergency types."""
@@ -195,7 +350,7 @@ class PAGASystem:
     
     def _initialize_message_templates(self) -> Dict[str, Dict]:
         """Initialize pre-recorded message templates."""
-        return {
+        templates = {
             "fire_emergency": {
                 "message": "ATTENTION ALL PERSONNEL. FIRE ALARM IN {zone}. PROCEED TO EMERGENCY STATIONS. THIS IS NOT A DRILL.",
                 "language": "english",
@@ -245,11 +400,92 @@ class PAGASystem:
                 "priority": AnnouncementPriority.MEDIUM
             }
         }
+        
+        # Resolve placeholders and the log preview once rather than per broadcast
+        for template in templates.values():
+            template["placeholders"] = frozenset(re.findall(r"\{(\w+)\}", template["message"]))
+            template["preview"] = template["message"][:50]
+        
+        return templates
+    
+    def _build_speaker_table(self):
+        """Build parallel speaker and zone arrays from self.speakers and self.zones."""
+        self._spk_index = {key: i for i, key in enumerate(self.speakers)}
+        self._spk_zone_idx = np.array(
+            [_ZONE_NAME_TO_IDX[speaker.zone] for speaker in self.speakers.values()], dtype=np.uint8
+        )
+        self._spk_status = np.array(
+            [_SPEAKER_ONLINE if speaker.status == "online" else _SPEAKER_OFFLINE
+             for speaker in self.speakers.values()],
+            dtype=np.uint8
+        )
+        self._zone_volume = np.array(
+            [self.zones[zone_name]["volume_level"] for zone_name in _SPEAKER_ZONES], dtype=np.uint8
+        )
+        self._zone_backup_power = np.array(
+            [self.zones[zone_name].get("backup_power", False) for zone_name in _SPEAKER_ZONES], dtype=bool
+        )
+    
+    @staticmethod
+    def _zone_names(zones: Optional[List]) -> List[str]:
+        """Normalize target zones given as names or Zone members to names (None = all zones)."""
+        if zones is None:
+            return ["all_zones"]
+        return [zone.name.lower() if isinstance(zone, Zone) else zone for zone in zones]
+    
+    def _set_speaker_status(self, speaker_key: str, status: str):
+        """Change a speaker's status, keeping the online counter and table current."""
+        speaker = self.speakers[speaker_key]
+        was_online = speaker.status == "online"
+        speaker.status = status
+        self._state_version += 1
+        is_online = status == "online"
+        self._online_speaker_count += is_online - was_online
+        self._spk_status[self._spk_index[speaker_key]] = _SPEAKER_ONLINE if is_online else _SPEAKER_OFFLINE
+    
+    def _set_announcement_status(self, announcement: Announcement, status: str):
+        """Change an announcement's status, keeping the playing counter current."""
+        was_playing = announcement.status == "playing"
+        announcement.status = status
+        self._state_version += 1
+        self._active_announcement_count += (status == "playing") - was_playing
+    
+    def _alloc_announcement(self, **fields) -> Announcement:
+        """Take an announcement record from the pool, allocating one if it is empty."""
+        if not self._ann_pool:
+            return Announcement(**fields)
+        
+        # Re-running the dataclass __init__ resets every field, defaults included
+        announcement = self._ann_pool.pop()
+        announcement.__init__(**fields)
+        return announcement
+    
+    def _retire_announcement(self, entry_id: str):
+        """Record a completed entry, evicting the oldest past the history limit into the pool."""
+        self._finished_ids.append(entry_id)
+        if len(self._finished_ids) > _ANNOUNCEMENT_HISTORY:
+            announcement = self.active_announcements.pop(self._finished_ids.popleft(), None)
+            if announcement is not None and len(self._ann_pool) < _ANNOUNCEMENT_POOL_SIZE:
+                self._ann_pool.append(announcement)
+    
+    def _push_priority(self, priority: AnnouncementPriority, entry_id: str):
+        """Queue a live alarm or announcement for priority ordering."""
+        heapq.heappush(self._priority_heap, (_PRIORITY_RANK[priority], time.monotonic(), entry_id))
+    
+    def _current_announcement(self) -> Optional[str]:
+        """Id of the highest-priority alarm or announcement still live."""
+        heap = self._priority_heap
+        while heap:
+            entry = self.active_announcements.get(heap[0][2])
+            if entry is not None and entry.status in ("active", "playing"):
+                return heap[0][2]
+            heapq.heappop(heap)
+        return None
     
     async def register_integration_callback(self, callback):
         """Register callback for system integration."""
         self.integration_callbacks.append(callback)
-        logger.debug(f"Integration callback registered: {callback.__name__}")
+        logger.debug("Integration callback registered: {}", callback.__name__)
     
     async def trigger_alarm(self, alarm_type: AlarmType, zones: List[str] = None,
                            custom_message: str = None) -> Dict:
@@ -264,10 +500,9 @@ class PAGASystem:
         Returns:
             Dict with alarm activation result
         """
-        logger.critical(f"📢 PAGA ALARM TRIGGERED: {alarm_type.value}")
+        logger.critical("📢 PAGA ALARM TRIGGERED: {}", alarm_type.value)
         
-        if zones is None:
-            zones = ["all_zones"]
+        zones = self._zone_names(zones)
         
         # Update system status
         self.status = SystemStatus.ALARM
@@ -275,34 +510,41 @@ class PAGASystem:
         # Get alarm sequence configuration
         alarm_config = self.alarm_sequences[alarm_type]
         
+        now = datetime.utcnow()
+        now_iso = now.isoformat()
+        
         # Create alarm session
-        alarm_id = f"ALM-{alarm_type.value.upper()}-{int(datetime.utcnow().timestamp())}"
+        alarm_id = f"{self._alarm_prefix[alarm_type]}{next(self._alarm_counter):08d}"
         
         # Start alarm sequence
         await self._start_alarm_sequence(alarm_id, alarm_type, alarm_config, zones)
         
         # Follow with voice announcement if available
-        if alarm_type.value in self.message_templates:
+        template_key = _ALARM_TEMPLATES.get(alarm_type)
+        if template_key is not None:
             await asyncio.sleep(2)  # Brief pause after alarm
-            await self._broadcast_announcement(alarm_type.value, zones, custom_message)
+            await self._broadcast_announcement(template_key, zones, custom_message)
         
         # Record alarm activation
-        self.active_announcements[alarm_id] = {
-            "type": "alarm",
-            "alarm_type": alarm_type,
-            "zones": zones,
-            "start_time": datetime.utcnow(),
-            "status": "active",
-            "duration": alarm_config["duration"],
-            "custom_message": custom_message
-        }
+        self.active_announcements[alarm_id] = self._alloc_announcement(
+            type="alarm",
+            alarm_type=alarm_type,
+            zones=zones,
+            start_time=now,
+            status="active",
+            duration=alarm_config["duration"],
+            custom_message=custom_message
+        )
+        self._active_alarms.add(alarm_id)
+        self._state_version += 1
+        self._push_priority(AnnouncementPriority.EMERGENCY, alarm_id)
         
         # Notify integrated systems
         await self._notify_integrated_systems("alarm_activated", {
             "alarm_id": alarm_id,
             "alarm_type": alarm_type.value,
             "zones": zones,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso
         })
         
         # Log alarm event
@@ -310,11 +552,10 @@ class PAGASystem:
             event_type="PAGA_ALARM_ACTIVATED",
             severity=EventSeverity.EMERGENCY,
             message=f"PAGA alarm activated: {alarm_type.value}",
-            additional_data=json.dumps({
-                "alarm_id": alarm_id,
-                "zones": zones,
-                "duration": alarm_config["duration"]
-            })
+            additional_data=(
+                f'{self._alarm_log_prefix[alarm_type]},"alarm_id":"{alarm_id}",'
+                f'"zones":{_ALL_ZONES_JSON if zones == _ALL_ZONES else json.dumps(zones)}}}'
+            )
         )
         
         return {
@@ -323,33 +564,31 @@ class PAGASystem:
             "alarm_type": alarm_type.value,
             "zones": zones,
             "duration": alarm_config["duration"],
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso
         }
     
     async def _start_alarm_sequence(self, alarm_id: str, alarm_type: AlarmType,
                                    alarm_config: Dict, zones: List[str]):
         """Start alarm sequence playback."""
-        logger.warning(f"🚨 Starting alarm sequence: {alarm_config['sequence']}")
+        logger.warning("🚨 Starting alarm sequence: {}", alarm_config['sequence'])
         
         # Simulate alarm sequence (in real system this would control actual audio hardware)
         duration = alarm_config["duration"]
         
         # Schedule alarm completion
-        asyncio.create_task(self._complete_alarm_sequence(alarm_id, duration))
+        self._schedule_completion(duration, alarm_id, "alarm")
     
-    async def _complete_alarm_sequence(self, alarm_id: str, duration: int):
-        """Complete alarm sequence after specified duration."""
-        await asyncio.sleep(duration)
-        
+    async def _complete_alarm_sequence(self, alarm_id: str):
+        """Complete alarm sequence once its duration has elapsed."""
         if alarm_id in self.active_announcements:
-            self.active_announcements[alarm_id]["status"] = "completed"
-            logger.info(f"✅ Alarm sequence completed: {alarm_id}")
+            self.active_announcements[alarm_id].status = "completed"
+            self._active_alarms.discard(alarm_id)
+            self._state_version += 1
+            self._retire_announcement(alarm_id)
+            logger.info("✅ Alarm sequence completed: {}", alarm_id)
             
             # Check if any other alarms are active
-            active_alarms = [a for a in self.active_announcements.values() 
-                           if a["type"] == "alarm" and a["status"] == "active"]
-            
-            if not active_alarms:
+            if not self._active_alarms:
                 self.status = SystemStatus.NORMAL
                 logger.info("📢 All PAGA alarms completed - System returned to normal")
     
@@ -357,44 +596,52 @@ class PAGASystem:
                                      custom_message: str = None):
         """Broadcast voice announcement to specified zones."""
         if template_key not in self.message_templates:
-            logger.error(f"Unknown message template: {template_key}")
+            logger.error("Unknown message template: {}", template_key)
             return
         
         template = self.message_templates[template_key]
         message = template["message"]
+        preview = template["preview"]
         
         # Replace placeholders if custom message provided
-        if custom_message and "{custom_message}" in message:
+        if custom_message and "custom_message" in template["placeholders"]:
             message = message.replace("{custom_message}", custom_message)
+            preview = message[:50]
         
-        logger.info(f"📢 Broadcasting announcement: {message[:50]}...")
+        logger.info("📢 Broadcasting announcement: {}...", preview)
         
         # Create announcement session
-        announcement_id = f"ANN-{int(datetime.utcnow().timestamp())}"
-        
-        self.active_announcements[announcement_id] = {
-            "type": "announcement",
-            "template": template_key,
-            "message": message,
-            "zones": zones,
-            "start_time": datetime.utcnow(),
-            "duration": template["duration"],
-            "priority": template["priority"],
-            "status": "playing"
-        }
+        now = datetime.utcnow()
+        announcement_id = f"ANN-{next(self._ann_counter):08d}"
+        
+        announcement = self.active_announcements[announcement_id] = self._alloc_announcement(
+            type="announcement",
+            template=template_key,
+            message=message,
+            zones=zones,
+            start_time=now,
+            duration=template["duration"],
+            priority=template["priority"]
+        )
+        self._set_announcement_status(announcement, "playing")
+        self._push_priority(template["priority"], announcement_id)
         
         # Schedule announcement completion
-        asyncio.create_task(self._complete_announcement(announcement_id, template["duration"]))
+        self._schedule_completion(template["duration"], announcement_id, "announcement")
         
         return announcement_id
     
-    async def _complete_announcement(self, announcement_id: str, duration: int):
-        """Complete announcement after specified duration."""
-        await asyncio.sleep(duration)
-        
+    async def _complete_announcement(self, announcement_id: str):
+        """Complete announcement once its duration has elapsed."""
         if announcement_id in self.active_announcements:
-            self.active_announcements[announcement_id]["status"] = "completed"
-            logger.debug(f"📢 Announcement completed: {announcement_id}")
+            self._set_announcement_status(self.active_announcements[announcement_id], "completed")
+            self._retire_announcement(announcement_id)
+            logger.debug("📢 Announcement completed: {}", announcement_id)
+    
+    def _schedule_completion(self, delay: float, entry_id: str, kind: str):
+        """Schedule an alarm or announcement to complete after delay seconds."""
+        complete = self._complete_alarm_sequence if kind == "alarm" else self._complete_announcement
+        self._deadlines.schedule(delay, partial(complete, entry_id))
     
     async def make_announcement(self, message: str, zones: List[str] = None,
                               priority: AnnouncementPriority = AnnouncementPriority.MEDIUM) -> Dict:
@@ -409,29 +656,32 @@ class PAGASystem:
         Returns:
             Dict with announcement result
         """
-        if zones is None:
-            zones = ["all_zones"]
+        zones = self._zone_names(zones)
         
-        logger.info(f"📢 Making announcement to zones {zones}: {message[:50]}...")
+        logger.opt(lazy=True).info(
+            "📢 Making announcement to zones {}: {}...", lambda: zones, lambda: message[:50]
+        )
         
         # Create announcement session
-        announcement_id = f"ANN-{int(datetime.utcnow().timestamp())}"
+        now = datetime.utcnow()
+        announcement_id = f"ANN-{next(self._ann_counter):08d}"
         
         # Estimate duration based on message length (rough calculation)
         estimated_duration = max(5, len(message) // 10)
         
-        self.active_announcements[announcement_id] = {
-            "type": "custom_announcement",
-            "message": message,
-            "zones": zones,
-            "start_time": datetime.utcnow(),
-            "duration": estimated_duration,
-            "priority": priority,
-            "status": "playing"
-        }
+        announcement = self.active_announcements[announcement_id] = self._alloc_announcement(
+            type="custom_announcement",
+            message=message,
+            zones=zones,
+            start_time=now,
+            duration=estimated_duration,
+            priority=priority
+        )
+        self._set_announcement_status(announcement, "playing")
+        self._push_priority(priority, announcement_id)
         
         # Schedule completion
-        asyncio.create_task(self._complete_announcement(announcement_id, estimated_duration))
+        self._schedule_completion(estimated_duration, announcement_id, "announcement")
         
         # Log announcement
         await self._log_event(
@@ -452,7 +702,7 @@ class PAGASystem:
             "zones": zones,
             "priority": priority.value,
             "estimated_duration": estimated_duration,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now.isoformat()
         }
     
     async def stop_announcement(self, announcement_id: str) -> Dict:
@@ -461,11 +711,11 @@ class PAGASystem:
             return {"success": False, "error": f"Announcement {announcement_id} not found"}
         
         announcement = self.active_announcements[announcement_id]
-        if announcement["status"] != "playing":
+        if announcement.status != "playing":
             return {"success": False, "error": f"Announcement {announcement_id} is not active"}
         
-        announcement["status"] = "stopped"
-        logger.info(f"🛑 Announcement stopped: {announcement_id}")
+        self._set_announcement_status(announcement, "stopped")
+        logger.info("🛑 Announcement stopped: {}", announcement_id)
         
         return {
             "success": True,
@@ -473,23 +723,36 @@ class PAGASystem:
             "stopped_at": datetime.utcnow().isoformat()
         }
     
-    async def get_system_status(self) -> Dict:
-        """Get current PAGA system status."""
-        active_announcements = sum(1 for a in self.active_announcements.values() 
-                                 if a["status"] == "playing")
-        online_speakers = sum(1 for s in self.speakers.values() if s["status"] == "online")
+    async def get_system_status(self, now: Optional[datetime] = None,
+                                if_version: Optional[int] = None) -> Dict:
+        """
+        Get current PAGA system status.
+        
+        Args:
+            now: Current UTC time, so a caller polling several systems can
+                share one reading (defaults to utcnow)
+            if_version: State version the caller already holds; if it is
+                still current only a short unchanged response is returned
+        """
+        if if_version == self._state_version:
+            return {"unchanged": True, "version": self._state_version}
         
         return {
             "system_type": self.system_type.value,
             "status": self.status.value,
-            "zones": self.zones,
+            "zones": self._zones_view,
             "total_speakers": len(self.speakers),
-            "online_speakers": online_speakers,
-            "active_announcements": active_announcements,
-            "announcement_details": self.active_announcements,
-            "alarm_types_available": [alarm.value for alarm in AlarmType],
+            "online_speakers": self._online_speaker_count,
+            "active_announcements": self._active_announcement_count,
+            "announcement_details": {
+                announcement_id: asdict(announcement)
+                for announcement_id, announcement in self.active_announcements.items()
+            },
+            "current_announcement": self._current_announcement(),
+            "alarm_types_available": _ALARM_TYPES_AVAILABLE,
             "last_test": self.last_test.isoformat() if self.last_test else None,
-            "performance_score": self._calculate_performance_score()
+            "performance_score": self._calculate_performance_score(now),
+            "version": self._state_version
         }
     
     async def perform_system_test(self) -> Dict:
@@ -497,45 +760,37 @@ class PAGASystem:
         logger.info("🧪 Performing PAGA system test")
         
         self.last_test = datetime.utcnow()
+        self._state_version += 1
         test_results = {}
         
-        # Test each zone
-        for zone_name, zone_data in self.zones.items():
-            if zone_name == "all_zones":
-                continue
-                
-            # Test zone speakers
-            zone_speakers = [s for s in self.speakers.values() if s["zone"] == zone_name]
-            online_count = sum(1 for s in zone_speakers if s["status"] == "online")
-            
-            # Test alarm functionality
-            alarm_test = True  # Simulated test
-            volume_test = zone_data["volume_level"] >= 5
-            backup_power_test = zone_data.get("backup_power", False)
-            
+        # Count total and online speakers for every zone at once
+        zone_count = len(_SPEAKER_ZONES)
+        online = self._spk_status == _SPEAKER_ONLINE
+        total_per_zone = np.bincount(self._spk_zone_idx, minlength=zone_count)
+        online_per_zone = np.bincount(self._spk_zone_idx[online], minlength=zone_count)
+        
+        # Evaluate every zone's checks as arrays (alarm test is simulated as always passing)
+        speaker_pass = online_per_zone == total_per_zone
+        volume_pass = self._zone_volume >= 5
+        overall_pass = speaker_pass & volume_pass
+        
+        # Format per-zone results
+        for zone_name, speaker_count, online_count, speaker_ok, volume_ok, backup_ok, overall_ok in zip(
+            _SPEAKER_ZONES, total_per_zone.tolist(), online_per_zone.tolist(), speaker_pass.tolist(),
+            volume_pass.tolist(), self._zone_backup_power.tolist(), overall_pass.tolist()
+        ):
             test_results[zone_name] = {
-                "speaker_count": len(zone_speakers),
+                "speaker_count": speaker_count,
                 "online_speakers": online_count,
-                "speaker_test": "PASS" if online_count == len(zone_speakers) else "FAIL",
-                "alarm_test": "PASS" if alarm_test else "FAIL",
-                "volume_test": "PASS" if volume_test else "FAIL",
-                "backup_power_test": "PASS" if backup_power_test else "N/A",
-                "overall": "PASS" if all([
-                    online_count == len(zone_speakers),
-                    alarm_test,
-                    volume_test
-                ]) else "FAIL"
+                "speaker_test": "PASS" if speaker_ok else "FAIL",
+                "alarm_test": "PASS",
+                "volume_test": "PASS" if volume_ok else "FAIL",
+                "backup_power_test": "PASS" if backup_ok else "N/A",
+                "overall": "PASS" if overall_ok else "FAIL"
             }
         
         # Test alarm sequences
-        alarm_test_results = {}
-        for alarm_type in AlarmType:
-            alarm_test_results[alarm_type.value] = {
-                "sequence_available": True,
-                "frequency_test": "PASS",
-                "duration_test": "PASS",
-                "override_test": "PASS"
-            }
+        alarm_test_results = {alarm_type: _ALARM_TEST_RESULT.copy() for alarm_type in _ALARM_TYPES_AVAILABLE}
         
         # Log test completion
         await self._log_event(
@@ -556,17 +811,23 @@ class PAGASystem:
             "overall_status": "PASS"
         }
     
-    def _calculate_performance_score(self) -> float:
+    def _calculate_performance_score(self, now: Optional[datetime] = None) -> float:
         """Calculate system performance score."""
+        days_since_test = ((now or datetime.utcnow()) - self.last_test).days if self.last_test else None
+        
+        # The score only moves with system state or the age of the last test
+        cache = self._score_cache
+        if cache is not None and cache[0] == self._state_version and cache[1] == days_since_test:
+            return cache[2]
+        
         base_score = 100.0
         
         # Reduce score for offline speakers
-        offline_speakers = sum(1 for s in self.speakers.values() if s["status"] != "online")
+        offline_speakers = len(self.speakers) - self._online_speaker_count
         base_score -= offline_speakers * 2
         
         # Reduce score if last test was too long ago
-        if self.last_test:
-            days_since_test = (datetime.utcnow() - self.last_test).days
+        if days_since_test is not None:
             if days_since_test > 7:  # Weekly testing recommended
                 base_score -= min(days_since_test - 7, 30)
         else:
@@ -577,21 +838,16 @@ class PAGASystem:
             if zone_data["status"] != "active":
                 base_score -= 10
         
-        return max(0, base_score)
+        score = max(0, base_score)
+        self._score_cache = (self._state_version, days_since_test, score)
+        return score
     
     async def handle_emergency_event(self, event_type: str, event_data: Dict) -> Dict:
         """Handle emergency events with appropriate PAGA response."""
-        logger.warning(f"📢 PAGA responding to emergency: {event_type}")
+        logger.warning("📢 PAGA responding to emergency: {}", event_type)
         
         # Map event types to alarm types
-        event_alarm_map = {
-            "fire_alarm": AlarmType.FIRE_ALARM,
-            "emergency_stop": AlarmType.GENERAL_ALARM,
-            "man_overboard": AlarmType.MAN_OVERBOARD,
-            "abandon_ship": AlarmType.ABANDON_SHIP
-        }
-        
-        alarm_type = event_alarm_map.get(event_type, AlarmType.GENERAL_ALARM)
+        alarm_type = _EVENT_ALARM_MAP.get(event_type, AlarmType.GENERAL_ALARM)
         
         # Determine zones based on event location
         zones = None
@@ -612,14 +868,28 @@ class PAGASystem:
     
     async def _notify_integrated_systems(self, event_type: str, data: Dict):
         """Notify other systems of PAGA events."""
-        for callback in self.integration_callbacks:
-            try:
-                await callback(self.system_type, event_type, data)
-            except Exception as e:
-                logger.error(f"Error notifying integrated system: {e}")
+        # Every subscriber receives the same event with a read-only view of
+        # its data, so no callback can alter what the others see
+        event = PAGAEvent(self.system_type, event_type, MappingProxyType(data))
+        
+        # Integrations run concurrently so the alarm path waits for the
+        # slowest subscriber rather than the sum of them
+        async def notify(callback):
+            async with self._notify_sem:
+                return await callback(*event)
+        
+        callbacks = list(self.integration_callbacks)
+        results = await asyncio.gather(*(notify(callback) for callback in callbacks), return_exceptions=True)
+        for callback, result in zip(callbacks, results):
+            if isinstance(result, Exception):
+                logger.error("Error notifying integrated system {}: {}", callback.__name__, result)
     
     async def _log_event(self, event_type: str, severity: EventSeverity,
                         message: str, location: str = None, additional_data: str = None):
         """Log system event to database."""
         # This would be implemented with actual database logging
-        logger.info(f"Event logged: {event_type} - {message}") 
\ No newline at end of file
+        logger.info("Event logged: {} - {}", event_type, message) 
+    
+    async def aclose(self):
+        """Stop the alarm and announcement completion worker."""
+        await self._deadlines.aclose()
@@ -0,0 +1,148 @@
+"""Tests for journal replay, shutdown, sensor event routing and status snapshots in the fire detection system."""
+
+import asyncio
+import contextlib
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from loguru import logger
+
+from systems.fire_detection import FireDetectionSystem
+
+
+def setUpModule():
+    logger.disable("systems")
+
+
+def tearDownModule():
+    logger.enable("systems")
+
+
+def _trigger_entry(seq, alarm_id, zone, started_ago, suppression_delay):
+    return {
+        "seq": seq,
+        "event": "trigger",
+        "alarm_id": alarm_id,
+        "zone": zone,
+        "detector_id": None,
+        "cause": "Manual activation",
+        "start_time": (datetime.utcnow() - timedelta(seconds=started_ago)).isoformat(),
+        "evacuation_ordered": True,
+        "suppression_delay": suppression_delay
+    }
+
+
+class JournalReplayTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.journal_path = Path(self._tmp.name) / "fire_alarm_journal.jsonl"
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def _write_journal(self, *entries):
+        self.journal_path.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+    
+    async def test_replayed_alarm_discharges_suppression_after_resume(self):
+        self._write_journal(_trigger_entry(1, "FA-ENGINE_ROOM-1", "engine_room", 59.9, 60))
+        system = FireDetectionSystem(seed=1, journal_path=str(self.journal_path))
+        self.assertIn("FA-ENGINE_ROOM-1", system.active_alarms)
+        
+        await system.resume_suppression_timers()
+        await asyncio.sleep(0.3)
+        
+        self.assertTrue(system.active_alarms["FA-ENGINE_ROOM-1"].suppression_activated)
+        self.assertEqual(system.suppression_systems["engine_room"].status, "discharging")
+        await system.aclose()
+    
+    async def test_compaction_drops_alarms_that_were_not_restored(self):
+        self._write_journal(
+            _trigger_entry(1, "FA-ENGINE_ROOM-1", "engine_room", 5, 60),
+            _trigger_entry(2, "FA-ENGINE_ROOM-2", "engine_room", 5, 60),
+            _trigger_entry(3, "FA-NOWHERE-3", "nowhere", 5, 60)
+        )
+        system = FireDetectionSystem(seed=1, journal_path=str(self.journal_path))
+        
+        compacted = [json.loads(line) for line in self.journal_path.read_text().splitlines()]
+        self.assertEqual([entry["alarm_id"] for entry in compacted], ["FA-ENGINE_ROOM-1"])
+        self.assertEqual(list(system.active_alarms), ["FA-ENGINE_ROOM-1"])
+    
+    async def test_aclose_stops_timer_worker(self):
+        system = FireDetectionSystem(seed=1, journal_path=str(self.journal_path))
+        await system.trigger_fire_alarm("engine_room")
+        timer_task = system._timers.task
+        self.assertIsNotNone(timer_task)
+        
+        await system.aclose()
+        
+        self.assertTrue(timer_task.done())
+        self.assertIsNone(system._timers.task)
+
+
+class SensorEventTest(unittest.IsolatedAsyncioTestCase):
+    async def test_simulated_readings_never_trip_detectors(self):
+        system = FireDetectionSystem(seed=1)
+        for _ in range(20000):
+            await system._update_sensor_readings()
+            while not system._event_q.empty():
+                await system._apply_sensor_event(system._event_q.get_nowait())
+        
+        self.assertEqual(system.active_alarms, {})
+        await system.aclose()
+    
+    async def test_published_reading_over_threshold_raises_alarm(self):
+        system = FireDetectionSystem(seed=1)
+        system.publish_sensor_reading("bridge", "smoke_level", 50.0)
+        await system._apply_sensor_event(system._event_q.get_nowait())
+        
+        self.assertEqual([alarm.zone for alarm in system.active_alarms.values()], ["bridge"])
+        await system.aclose()
+    
+    async def test_sensor_batches_go_to_telemetry_subscribers_only(self):
+        system = FireDetectionSystem(seed=1)
+        safety_events, telemetry = [], []
+        
+        async def on_safety_event(system_type, event_type, data):
+            safety_events.append(event_type)
+        
+        async def on_telemetry(system_type, event_type, data):
+            telemetry.append(data["updates"])
+        
+        await system.register_integration_callback(on_safety_event)
+        await system.register_telemetry_callback(on_telemetry)
+        for value in (23.0, 24.0, 25.0):
+            system.publish_sensor_reading("bridge", "temperature", value)
+            await system._apply_sensor_event(system._event_q.get_nowait())
+        
+        notifier = asyncio.create_task(system._flush_sensor_notifications())
+        await asyncio.sleep(0.4)
+        notifier.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await notifier
+        
+        self.assertEqual(safety_events, [])
+        self.assertEqual(telemetry, [[{"zone": "bridge", "sensor": "temperature", "value": 25.0}]])
+        await system.aclose()
+
+
+class StatusSnapshotTest(unittest.IsolatedAsyncioTestCase):
+    async def test_status_sections_are_read_only(self):
+        system = FireDetectionSystem(seed=1)
+        await system.trigger_fire_alarm("galley")
+        status = await system.get_system_status()
+        
+        with self.assertRaises(TypeError):
+            status["zones"]["galley"]["alarm_level"] = "normal"
+        with self.assertRaises(TypeError):
+            del status["alarm_details"][next(iter(status["alarm_details"]))]
+        
+        status["status"] = "tampered"
+        self.assertEqual((await system.get_system_status())["status"], "alarm")
+        await system.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
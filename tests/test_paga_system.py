@@ -0,0 +1,50 @@
+"""Tests for alarm and announcement completion in the PAGA system."""
+
+import asyncio
+import unittest
+
+from loguru import logger
+
+from systems.paga_system import PAGASystem
+
+
+def setUpModule():
+    logger.disable("systems")
+
+
+def tearDownModule():
+    logger.enable("systems")
+
+
+class DeadlineWorkerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_earlier_deadline_completes_first(self):
+        paga = PAGASystem()
+        completed = []
+        
+        async def complete(announcement_id):
+            completed.append(announcement_id)
+        
+        paga._complete_announcement = complete
+        paga._schedule_completion(0.05, "ANN-LATER", "announcement")
+        paga._schedule_completion(0.01, "ANN-EARLIER", "announcement")
+        await asyncio.sleep(0.03)
+        self.assertEqual(completed, ["ANN-EARLIER"])
+        
+        await asyncio.sleep(0.05)
+        self.assertEqual(completed, ["ANN-EARLIER", "ANN-LATER"])
+        await paga.aclose()
+    
+    async def test_aclose_stops_deadline_worker(self):
+        paga = PAGASystem()
+        await paga.make_announcement("Fire drill will commence in five minutes")
+        deadline_task = paga._deadlines.task
+        self.assertIsNotNone(deadline_task)
+        
+        await paga.aclose()
+        
+        self.assertTrue(deadline_task.done())
+        self.assertIsNone(paga._deadlines.task)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""Tests for event batch processing in the safety system manager."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from loguru import logger
+
+from database.models import SystemType
+from systems.cctv_system import CCTVSystem
+from systems.communication import CommunicationSystem
+from systems.compliance_monitor import ComplianceMonitor
+from systems.emergency_stop import EmergencyStopSystem
+from systems.fire_detection import FireDetectionSystem
+from systems.paga_system import PAGASystem
+from systems.safety_manager import SafetySystemManager
+
+
+def setUpModule():
+    logger.disable("systems")
+
+
+def tearDownModule():
+    logger.enable("systems")
+
+
+class _ConnectionManager:
+    async def broadcast_text(self, payload):
+        pass
+
+
+def _event(source_system, event_type, event_data):
+    return {
+        "id": "EVT-1",
+        "source_system": source_system.value,
+        "event_type": event_type,
+        "event_data": event_data,
+        "processed": False,
+        "response_actions": []
+    }
+
+
+class EventBatchTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.manager = SafetySystemManager(
+            EmergencyStopSystem(), FireDetectionSystem(seed=1), CCTVSystem(), PAGASystem(),
+            CommunicationSystem(), ComplianceMonitor(), _ConnectionManager()
+        )
+        self.handled = []
+        
+        async def record(event_data):
+            self.handled.append(event_data)
+            return [f"handled {event_data.get('system', event_data.get('zone'))}"]
+        
+        self.manager._dispatch = {"system_fault": record, "fire_alarm": record, "emergency_stop": record}
+    
+    async def test_distinct_faults_each_get_a_response(self):
+        batch = [
+            _event(SystemType.CCTV, "system_fault", {"system": "cctv", "fault": "camera offline"}),
+            _event(SystemType.PAGA, "system_fault", {"system": "paga", "fault": "amplifier failure"})
+        ]
+        
+        await self.manager._process_event_batch(batch)
+        
+        self.assertEqual(len(self.handled), 2)
+        self.assertEqual([event["response_actions"] for event in batch], [["handled cctv"], ["handled paga"]])
+        self.assertTrue(all(event["processed"] for event in batch))
+    
+    async def test_repeated_fire_alarm_shares_a_response(self):
+        batch = [
+            _event(SystemType.FIRE_DETECTION, "fire_alarm", {"zone": "galley", "alarm_id": "FIRE-GALLEY-1"}),
+            _event(SystemType.FIRE_DETECTION, "fire_alarm", {"zone": "galley", "alarm_id": "FIRE-GALLEY-1"}),
+            _event(SystemType.FIRE_DETECTION, "fire_alarm", {"zone": "bridge", "alarm_id": "FIRE-BRIDGE-1"})
+        ]
+        
+        await self.manager._process_event_batch(batch)
+        
+        self.assertEqual([data["alarm_id"] for data in self.handled], ["FIRE-GALLEY-1", "FIRE-BRIDGE-1"])
+        self.assertEqual(batch[1]["response_actions"], ["handled galley"])
+        self.assertTrue(all(event["processed"] for event in batch))
+    
+    async def test_distinct_emergency_stops_in_one_zone_each_get_a_response(self):
+        batch = [
+            _event(SystemType.EMERGENCY_STOP, "emergency_stop", {"zone": "engine_room", "reason": "manual"}),
+            _event(SystemType.EMERGENCY_STOP, "emergency_stop",
+                   {"zone": "engine_room", "reason": "overspeed", "affected_machinery": ["main_engine"]})
+        ]
+        
+        await self.manager._process_event_batch(batch)
+        
+        self.assertEqual([data["reason"] for data in self.handled], ["manual", "overspeed"])
+
+
+
+class EventBackpressureTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.manager = SafetySystemManager(
+            EmergencyStopSystem(), FireDetectionSystem(seed=1), CCTVSystem(), PAGASystem(),
+            CommunicationSystem(), ComplianceMonitor(), _ConnectionManager()
+        )
+        self.manager.event_queue = asyncio.Queue(maxsize=1)
+        # Pin the clock so every event shares one per-second id
+        patcher = mock.patch("systems.safety_manager.time.time", return_value=1_700_000_000.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def _pending(self):
+        queued = [self.manager.event_queue.get_nowait() for _ in range(self.manager.event_queue.qsize())]
+        return [event["event_data"] for event in [*queued, *self.manager._critical_overflow]]
+    
+    async def test_fire_alarms_in_other_zones_are_never_merged(self):
+        await self.manager._handle_system_event(
+            SystemType.FIRE_DETECTION, "fire_alarm", {"zone": "engine_room", "alarm_id": "A"})
+        await self.manager._handle_system_event(
+            SystemType.FIRE_DETECTION, "fire_alarm", {"zone": "cargo_hold", "alarm_id": "B"})
+        
+        self.assertEqual(self._pending(), [{"zone": "engine_room", "alarm_id": "A"},
+                                           {"zone": "cargo_hold", "alarm_id": "B"}])
+        self.assertEqual((self.manager._events_coalesced, self.manager._events_dropped), (0, 0))
+    
+    async def test_identical_non_critical_events_are_coalesced(self):
+        for fault in ("camera offline", "camera offline (retry)"):
+            await self.manager._handle_system_event(SystemType.CCTV, "system_fault", {"system": "cctv", "fault": fault})
+        
+        self.assertEqual(self._pending(), [{"system": "cctv", "fault": "camera offline (retry)"}])
+        self.assertEqual(self.manager._events_coalesced, 1)
+
+
+
+class ResetAllSystemsTest(unittest.IsolatedAsyncioTestCase):
+    async def test_failed_alarm_resets_are_reported(self):
+        fire = FireDetectionSystem(seed=1)
+        manager = SafetySystemManager(
+            EmergencyStopSystem(), fire, CCTVSystem(), PAGASystem(),
+            CommunicationSystem(), ComplianceMonitor(), _ConnectionManager()
+        )
+        await fire.trigger_fire_alarm("galley")
+        await fire.trigger_fire_alarm("bridge")
+        failing = next(iter(fire.active_alarms))
+        reset_fire_alarm = fire.reset_fire_alarm
+        
+        async def flaky_reset(alarm_id):
+            if alarm_id == failing:
+                raise RuntimeError("panel not responding")
+            return await reset_fire_alarm(alarm_id)
+        
+        fire.reset_fire_alarm = flaky_reset
+        result = await manager.reset_all_systems()
+        
+        self.assertEqual(result["details"]["fire_detection"], {"alarms_reset": 1, "failed_alarms": [failing]})
+        await fire.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Deadline scheduler for Ship Safety System Integration Platform
+Runs coroutine callbacks at deadlines on the event loop's monotonic clock
+from a single worker, instead of one sleeping task per timer.
+"""
+
+import asyncio
+import heapq
+import itertools
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from loguru import logger
+
+class DeadlineScheduler:
+    """
+    Heap of (deadline, sequence, callback) entries served by one worker.
+    
+    Callbacks run one at a time in deadline order; scheduling an entry
+    earlier than the current head wakes the worker to shorten its wait.
+    """
+    
+    def __init__(self, name: str, autostart: bool = True):
+        """
+        Args:
+            name: Owner name used in error messages
+            autostart: Start the worker task on the first schedule call;
+                otherwise the owner runs run() itself, e.g. in a TaskGroup
+        """
+        self.name = name
+        self.autostart = autostart
+        self.task: Optional[asyncio.Task] = None
+        self._heap: List[Tuple[float, int, Callable[[], Awaitable]]] = []
+        self._seq = itertools.count()
+        self._wake = asyncio.Event()
+    
+    def schedule(self, delay: float, callback: Callable[[], Awaitable]):
+        """Run a coroutine callback after delay seconds."""
+        self.schedule_at(asyncio.get_running_loop().time() + delay, callback)
+    
+    def schedule_at(self, when: float, callback: Callable[[], Awaitable]):
+        """Run a coroutine callback at the given loop time."""
+        entry = (when, next(self._seq), callback)
+        heapq.heappush(self._heap, entry)
+        
+        if self.autostart and self.task is None:
+            self.task = asyncio.create_task(self.run())
+        elif self._heap[0] is entry:
+            # New earliest deadline - wake the worker to shorten its wait
+            self._wake.set()
+    
+    async def run(self):
+        """Run scheduled callbacks in deadline order until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wake.clear()
+            if not self._heap:
+                await self._wake.wait()
+                continue
+            
+            wait_time = self._heap[0][0] - loop.time()
+            if wait_time > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), wait_time)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            _, _, callback = heapq.heappop(self._heap)
+            try:
+                await callback()
+            except Exception as e:
+                logger.error("Error running scheduled {} action: {}", self.name, e)
+    
+    async def aclose(self):
+        """Cancel and await the autostarted worker; pending entries are discarded."""
+        self._heap.clear()
+        if self.task is None:
+            return
+        
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+        self.task = None
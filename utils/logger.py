@@ -35,7 +35,9 @@ def setup_logger():
         level="DEBUG",
         rotation="1 day",
         retention="30 days",
-        compression="zip"
+        compression="zip",  # Runs on the writer thread with enqueue
+        buffering=65536,
+        enqueue=True  # Write from a background thread, off the event loop
     )
     
     # Critical events log
@@ -44,7 +46,8 @@ def setup_logger():
         format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} | {message}",
         level="ERROR",
         rotation="1 day",
-        retention="90 days"
+        retention="90 days",
+        enqueue=True
     )
     
     return logger 
\ No newline at end of file